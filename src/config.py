@@ -1,6 +1,6 @@
 """Configuration constants for missing timesheet report."""
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 
 # Database connection settings
 DB_SERVER = "TFS2015SQL"
@@ -10,6 +10,71 @@ DB_USE_WINDOWS_AUTH = True
 # File paths
 LEAVE_HISTORY_FILE = r"C:\Users\lauram\AI - playground\Missing timesheet report\Leave History 1 Nov. - 1 Dec .xlsx"
 OUTPUT_FILE = r"C:\Users\lauram\AI - playground\Missing timesheet report\Missing_Timesheet_Report.xlsx"
+REGIONAL_ALLOCATIONS_FILE = (
+    r"C:\Users\lauram\AI - playground\Missing timesheet report\Regional people allocations LIVE.xlsx"
+)
+
+# Public holidays by office (the Office column of the regional allocations) and year. A week counts as
+# full leave when every weekday in it that isn't a holiday for the employee's office is covered. Employees
+# whose office or year has no calendar here must be on leave every weekday, and a warning is logged.
+_NZ_PUBLIC_HOLIDAYS: dict[int, frozenset[date]] = {
+    2025: frozenset(
+        {
+            date(2025, 1, 1),
+            date(2025, 1, 2),
+            date(2025, 2, 6),
+            date(2025, 4, 18),
+            date(2025, 4, 21),
+            date(2025, 4, 25),
+            date(2025, 6, 2),
+            date(2025, 6, 20),
+            date(2025, 10, 27),
+            date(2025, 12, 25),
+            date(2025, 12, 26),
+        }
+    ),
+    2026: frozenset(
+        {
+            date(2026, 1, 1),
+            date(2026, 1, 2),
+            date(2026, 2, 6),
+            date(2026, 4, 3),
+            date(2026, 4, 6),
+            date(2026, 4, 27),
+            date(2026, 6, 1),
+            date(2026, 7, 10),
+            date(2026, 10, 26),
+            date(2026, 12, 25),
+            date(2026, 12, 28),
+        }
+    ),
+}
+PUBLIC_HOLIDAYS: dict[str, dict[int, frozenset[date]]] = {
+    "New Zealand": _NZ_PUBLIC_HOLIDAYS,
+    "NZ Remote": _NZ_PUBLIC_HOLIDAYS,
+}
+
+# Snapshot of the last report run, queried by src.snapshot_query
+SNAPSHOT_FILE = r"C:\Users\lauram\AI - playground\Missing timesheet report\Missing_Timesheet_Snapshot.bin"
+
+# Multi-target mode: one entry per TimeTorque instance as
+# (name, server, database, leave history file, additional excluded employee IDs, regional allocations file)
+REPORT_TARGETS: tuple[tuple[str, str, str, str, frozenset[int], str | None], ...] = (
+    ("DataTorque", DB_SERVER, DB_NAME, LEAVE_HISTORY_FILE, frozenset(), REGIONAL_ALLOCATIONS_FILE),
+)
+MULTI_TARGET_OUTPUT_FILE = (
+    r"C:\Users\lauram\AI - playground\Missing timesheet report\Missing_Timesheet_Report_All_Targets.xlsx"
+)
+TARGET_MAX_WORKERS = 4
+TARGET_TIMEOUT_SECONDS = 120
+# Targets still queued or running when the whole run exceeds this are reported as failed
+TARGET_DEADLINE_SECONDS = 600
+
+# Service mode: submissions are cached for this many weeks and reloaded on a schedule
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8080
+SERVICE_REFRESH_SECONDS = 900
+SERVICE_LOOKBACK_WEEKS = 8
 
 # Report date - set to today's date to calculate last two weeks
 REPORT_DATE = datetime.now(UTC)
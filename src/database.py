@@ -23,13 +23,19 @@ def get_connection_string(server: str, database: str, use_windows_auth: bool) ->
     raise NotImplementedError(msg)
 
 
-def create_connection(server: str, database: str, use_windows_auth: bool) -> pyodbc.Connection:
+def create_connection(
+    server: str,
+    database: str,
+    use_windows_auth: bool,
+    timeout: int = 0,
+) -> pyodbc.Connection:
     """Create a connection to the SQL Server database.
 
     Args:
         server: SQL Server instance name.
         database: Database name.
         use_windows_auth: Whether to use Windows authentication.
+        timeout: Login and query timeout in seconds (0 waits indefinitely).
 
     Returns:
         A pyodbc Connection object.
@@ -38,7 +44,9 @@ def create_connection(server: str, database: str, use_windows_auth: bool) -> pyo
         pyodbc.Error: If connection fails.
     """
     conn_str = get_connection_string(server, database, use_windows_auth)
-    return pyodbc.connect(conn_str)
+    conn = pyodbc.connect(conn_str, timeout=timeout)
+    conn.timeout = timeout
+    return conn
 
 
 def get_all_employees(conn: pyodbc.Connection) -> pd.DataFrame:
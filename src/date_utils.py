@@ -56,3 +56,21 @@ def is_full_week_covered(
         return False
 
     return leave_start <= week_start and leave_end >= week_end
+
+
+def get_reporting_weeks(report_date: datetime) -> list[tuple[datetime, datetime]]:
+    """Split the reporting period into its Friday-Thursday weeks.
+
+    Args:
+        report_date: The date from which to calculate backwards.
+
+    Returns:
+        List of (week_start, week_end) tuples, oldest week first.
+    """
+    period_start, period_end = get_last_two_weeks(report_date)
+    weeks: list[tuple[datetime, datetime]] = []
+    week_start = period_start
+    while week_start <= period_end:
+        weeks.append((week_start, week_start + timedelta(days=6)))
+        week_start += timedelta(days=7)
+    return weeks
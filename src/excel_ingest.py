@@ -0,0 +1,148 @@
+"""Stream selected columns from Excel sheets into typed DataFrames."""
+
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+from openpyxl import load_workbook
+
+
+@dataclass(frozen=True)
+class SheetSpec:
+    """Which part of a workbook to read and how to type it."""
+
+    file_path: str
+    sheet_name: str | None = None  # None reads the first sheet
+    header_row: int = 0  # Zero-based, as with pandas header=
+    columns: tuple[str, ...] = ()  # Header names to keep; empty keeps every column
+    dtypes: tuple[tuple[str, str], ...] = ()  # (column name, pandas dtype) pairs
+
+
+def read_sheet(spec: SheetSpec) -> pd.DataFrame:
+    """Read one sheet in read-only mode, keeping only the requested columns.
+
+    Rows are streamed from the workbook up to the last requested column and
+    projected to the requested columns as they are read, so columns after
+    the last one kept are never materialised.
+    Rows where every kept column is blank are skipped.
+
+    Args:
+        spec: The workbook, sheet, header row, columns and dtypes to read.
+
+    Returns:
+        DataFrame with the requested columns, in the order requested.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        ValueError: If the sheet or a requested column is missing, or the
+            file can't be read as a workbook.
+    """
+    try:
+        workbook = load_workbook(spec.file_path, read_only=True, data_only=True)
+    except FileNotFoundError as e:
+        msg = f"Excel file not found: {spec.file_path}"
+        raise FileNotFoundError(msg) from e
+    except Exception as e:
+        msg = f"Error reading Excel file {spec.file_path}: {e}"
+        raise ValueError(msg) from e
+
+    try:
+        if spec.sheet_name is None:
+            worksheet = workbook.worksheets[0]
+        elif spec.sheet_name in workbook.sheetnames:
+            worksheet = workbook[spec.sheet_name]
+        else:
+            msg = f"Sheet '{spec.sheet_name}' not found in {spec.file_path}"
+            raise ValueError(msg)
+
+        header_row = spec.header_row + 1  # openpyxl rows are one-based
+        header = next(worksheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ())
+        names = list(spec.columns) or [str(name) for name in header if name is not None]
+        indexes = [_column_index(header, name, spec) for name in names]
+
+        # Columns past the last one kept are never read
+        rows = worksheet.iter_rows(min_row=header_row + 1, max_col=max(indexes, default=0) + 1, values_only=True)
+        records: list[list[Any]] = []
+        for row in rows:
+            record = [row[i] if i < len(row) else None for i in indexes]
+            if any(value is not None for value in record):
+                records.append(record)
+    finally:
+        workbook.close()
+
+    return _apply_dtypes(pd.DataFrame(records, columns=names), spec.dtypes)
+
+
+def read_sheets(specs: Sequence[SheetSpec], max_workers: int | None = None) -> list[pd.DataFrame]:
+    """Read several sheets, in parallel across processes when there is more than one.
+
+    Starting worker processes costs more than reading a couple of small
+    sheets, so this pays off for many or large sheets only.
+
+    Args:
+        specs: Sheets to read; the same file may appear more than once.
+        max_workers: Maximum worker processes (defaults to one per spec,
+            capped at the CPU count).
+
+    Returns:
+        One DataFrame per spec, in the order given.
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist.
+        ValueError: If a sheet or column is missing or a file is invalid.
+    """
+    if len(specs) <= 1:
+        return [read_sheet(spec) for spec in specs]
+
+    workers = max_workers or min(len(specs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(read_sheet, specs))
+
+
+def _column_index(header: tuple[Any, ...], name: str, spec: SheetSpec) -> int:
+    """Find a column by its header, ignoring surrounding whitespace.
+
+    Args:
+        header: Values of the header row.
+        name: Header name to look for.
+        spec: The spec being read, for the error message.
+
+    Returns:
+        Zero-based column index.
+
+    Raises:
+        ValueError: If no header matches.
+    """
+    labels = [str(label) if label is not None else "" for label in header]
+    if name in labels:
+        return labels.index(name)
+
+    stripped = [label.strip() for label in labels]
+    if name.strip() in stripped:
+        return stripped.index(name.strip())
+
+    msg = f"Column '{name}' not found in {spec.file_path} sheet '{spec.sheet_name or 'first'}'"
+    raise ValueError(msg)
+
+
+def _apply_dtypes(df: pd.DataFrame, dtypes: Iterable[tuple[str, str]]) -> pd.DataFrame:
+    """Convert columns to their declared dtypes, coercing unparseable values.
+
+    Args:
+        df: DataFrame of raw cell values.
+        dtypes: (column name, pandas dtype) pairs.
+
+    Returns:
+        DataFrame with converted columns.
+    """
+    for column, dtype in dtypes:
+        if dtype.startswith("datetime"):
+            df[column] = pd.to_datetime(df[column], errors="coerce").astype(dtype)
+        elif pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype)):
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(dtype)
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
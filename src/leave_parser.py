@@ -1,13 +1,36 @@
 """Parse and process leave history data from Excel."""
 
-from datetime import datetime
+import logging
+from collections.abc import Collection, Mapping
+from datetime import date, datetime, timedelta
 
 import pandas as pd
 
+from src.config import PUBLIC_HOLIDAYS
+from src.excel_ingest import SheetSpec, read_sheet
+
+logger = logging.getLogger(__name__)
+
+# Column A holds the Employee ID and column E the leave date, one row per day of leave
+LEAVE_EMPLOYEE_ID_COLUMN = "Id"
+LEAVE_DATE_COLUMN = "Date"
+LEAVE_STATUS_COLUMN = "Status"
+LEAVE_TAKEN_COLUMN = "Taken"  # Hours ("7.50") or days ("1.00d")
+
+# Pending requests may still be declined, so only these count as leave
+TAKEN_LEAVE_STATUSES = frozenset({"Approved", "Processed"})
+
+# Taken amounts for a full-time working day, in hours and in days
+FULL_DAY_HOURS = 7.5
+FULL_DAY_DAYS = 1.0
+
 
 def load_leave_history(file_path: str) -> pd.DataFrame:
     """Load leave history from Excel file.
 
+    Only the Employee ID (column A), leave date (column E), status and taken
+    columns are read.
+
     Args:
         file_path: Path to the Excel file containing leave history.
 
@@ -18,72 +41,166 @@ def load_leave_history(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If file doesn't exist.
         ValueError: If file format is invalid.
     """
-    try:
-        df = pd.read_excel(file_path)
-    except FileNotFoundError as e:
-        msg = f"Leave history file not found: {file_path}"
-        raise FileNotFoundError(msg) from e
-    except Exception as e:
-        msg = f"Error reading leave history file: {e}"
-        raise ValueError(msg) from e
+    return read_sheet(leave_history_spec(file_path))
 
-    return df
 
+def leave_history_spec(file_path: str) -> SheetSpec:
+    """Describe the leave history columns to read from a workbook.
+
+    Args:
+        file_path: Path to the Excel file containing leave history.
+
+    Returns:
+        SheetSpec for the first sheet's Employee ID, date, status and taken columns.
+    """
+    return SheetSpec(
+        file_path=file_path,
+        columns=(LEAVE_EMPLOYEE_ID_COLUMN, LEAVE_DATE_COLUMN, LEAVE_STATUS_COLUMN, LEAVE_TAKEN_COLUMN),
+        dtypes=((LEAVE_EMPLOYEE_ID_COLUMN, "Int64"), (LEAVE_DATE_COLUMN, "datetime64[ns]")),
+    )
 
-def get_employee_leave_periods(
+
+def get_full_week_leave(
     leave_df: pd.DataFrame,
-    employee_id: int,
-) -> list[tuple[datetime, datetime]]:
-    """Extract leave periods for a specific employee.
+    week_starts: list[datetime],
+    offices: Mapping[int, str] | None = None,
+    calendars: Mapping[str, Mapping[int, Collection[date]]] = PUBLIC_HOLIDAYS,
+) -> pd.DataFrame:
+    """Find employees whose leave covers every working day of a week.
+
+    Leave history has one row per day of leave. A Friday-Thursday week is
+    covered when every weekday in it that isn't a public holiday for the
+    employee's office has a full day of taken leave. A day counts when its
+    status is Approved or Processed (not Pending) and it isn't part-day
+    leave (see _is_full_day_taken). Frames without Status or Taken columns
+    count every row as a full day of taken leave.
+
+    Holidays aren't applied, and a warning is logged, for offices without a
+    calendar and for years their calendar doesn't cover; those employees
+    need leave on every weekday.
 
     Args:
         leave_df: DataFrame containing leave history.
-        employee_id: The employee ID to filter for.
+        week_starts: Start dates (Fridays) of the weeks to check.
+        offices: Employee ID to office name; employees without one have no
+            public holidays.
+        calendars: Public holidays, which need no leave, by office and year.
 
     Returns:
-        List of tuples containing (start_date, end_date) for each leave period.
+        DataFrame with columns EmployeeID and WeekStart (naive, midnight),
+        one row per fully covered employee-week.
     """
-    # Column A should contain Employee ID, Column E should contain leave dates
-    # This is a simplified implementation - adjust based on actual data structure
-
-    if leave_df.empty:
-        return []
+    empty = pd.DataFrame({"EmployeeID": pd.Series(dtype="int64"), "WeekStart": pd.Series(dtype="datetime64[ns]")})
+    if leave_df.empty or not {LEAVE_EMPLOYEE_ID_COLUMN, LEAVE_DATE_COLUMN} <= set(leave_df.columns):
+        return empty
+
+    taken = leave_df[_is_full_day_taken(leave_df)]
+    days = pd.DataFrame(
+        {
+            "EmployeeID": pd.to_numeric(taken[LEAVE_EMPLOYEE_ID_COLUMN], errors="coerce"),
+            "Date": pd.to_datetime(taken[LEAVE_DATE_COLUMN], errors="coerce").dt.normalize().astype("datetime64[ns]"),
+        }
+    ).dropna()
+
+    weekdays = _weekdays(week_starts)
+    days = days.merge(weekdays, on="Date").drop_duplicates()
+    if days.empty:
+        return empty
+
+    days["Office"] = days["EmployeeID"].map(offices or {}).fillna("").astype(str)
+    working_days = _working_days(weekdays, days["Office"].unique().tolist(), calendars)
+    days = days.merge(working_days, on=["Office", "Date", "WeekStart"])
+
+    counts = days.groupby(["EmployeeID", "Office", "WeekStart"]).size().rename("Days").reset_index()
+    required = working_days.groupby(["Office", "WeekStart"]).size().rename("Required").reset_index()
+    counts = counts.merge(required, on=["Office", "WeekStart"])
+    covered = counts[counts["Days"] >= counts["Required"]]
+    return pd.DataFrame(
+        {
+            "EmployeeID": covered["EmployeeID"].astype("int64"),
+            "WeekStart": covered["WeekStart"].astype("datetime64[ns]"),
+        }
+    ).reset_index(drop=True)
+
+
+def _is_full_day_taken(leave_df: pd.DataFrame) -> pd.Series:
+    """Check which leave rows are a full day of approved or processed leave.
+
+    A part-time employee's full day is shorter than a full-time one, so a
+    row is a full day when it's at least a full-time day or, if smaller, the
+    largest amount that employee took on any day in the same unit. A row
+    shorter than another of the employee's days is part-day leave. An
+    employee whose leave is all half days can't be told apart from a
+    part-time employee and is treated as one.
 
-    # Try to find employee ID in first column
-    first_col = leave_df.columns[0]
+    Args:
+        leave_df: DataFrame containing leave history.
 
-    try:
-        employee_leaves = leave_df[leave_df[first_col] == employee_id]
-    except (KeyError, IndexError):
-        return []
+    Returns:
+        Boolean Series, True for rows that count towards a full week.
+    """
+    keep = pd.Series(True, index=leave_df.index)
+    if LEAVE_STATUS_COLUMN in leave_df.columns:
+        keep &= leave_df[LEAVE_STATUS_COLUMN].fillna("").astype(str).str.strip().isin(TAKEN_LEAVE_STATUSES)
+    if LEAVE_TAKEN_COLUMN not in leave_df.columns:
+        return keep
 
-    if employee_leaves.empty:
-        return []
+    taken = leave_df[LEAVE_TAKEN_COLUMN].fillna("").astype(str).str.strip().str.lower()
+    in_days = taken.str.endswith("d")
+    amount = pd.to_numeric(taken.str.removesuffix("d"), errors="coerce")
+    full_time_day = in_days.map({True: FULL_DAY_DAYS, False: FULL_DAY_HOURS})
+    usual_day = amount.where(keep).groupby([leave_df[LEAVE_EMPLOYEE_ID_COLUMN], in_days]).transform("max")
+    return keep & (amount >= usual_day.clip(upper=full_time_day))
 
-    # Extract leave periods from column E (index 4)
-    leave_periods: list[tuple[datetime, datetime]] = []
 
-    # This needs to be implemented based on actual data structure
-    # For now, return empty list
-    return leave_periods
+def _weekdays(week_starts: list[datetime]) -> pd.DataFrame:
+    """List the weekdays of each week.
 
+    Args:
+        week_starts: Start dates (Fridays) of the weeks.
 
-def has_full_week_leave(
-    leave_df: pd.DataFrame,
-    employee_id: int,
-    week_start: datetime,
-    week_end: datetime,
-) -> bool:
-    """Check if employee has leave covering entire week.
+    Returns:
+        DataFrame with columns Date and WeekStart (naive, midnight), one row
+        per weekday.
+    """
+    rows: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+    for start in week_starts:
+        week_start = pd.Timestamp(start.replace(tzinfo=None)).normalize()
+        for offset in range(7):
+            day = week_start + timedelta(days=offset)
+            if day.dayofweek < 5:
+                rows.append((day, week_start))
+    return pd.DataFrame(rows, columns=["Date", "WeekStart"]).astype("datetime64[ns]")
+
+
+def _working_days(
+    weekdays: pd.DataFrame,
+    offices: list[str],
+    calendars: Mapping[str, Mapping[int, Collection[date]]],
+) -> pd.DataFrame:
+    """List the weekdays that aren't public holidays for each office.
 
     Args:
-        leave_df: DataFrame containing leave history.
-        employee_id: The employee ID to check.
-        week_start: Start of the week (Friday).
-        week_end: End of the week (Thursday).
+        weekdays: DataFrame returned by _weekdays.
+        offices: Offices to list working days for.
+        calendars: Public holidays by office and year.
 
     Returns:
-        True if employee has leave for the entire week, False otherwise.
+        DataFrame with columns Date, WeekStart and Office, one row per
+        working day per office.
     """
-    leave_periods = get_employee_leave_periods(leave_df, employee_id)
-    return any(start <= week_start and end >= week_end for start, end in leave_periods)
+    years = sorted(set(weekdays["Date"].dt.year.tolist()))
+    frames: list[pd.DataFrame] = []
+    for office in offices:
+        calendar = calendars.get(office)
+        if calendar is None:
+            logger.warning(
+                "No public holiday calendar for office %r, so its employees need leave every weekday", office
+            )
+            calendar = {}
+        elif uncovered := [year for year in years if year not in calendar]:
+            logger.warning("Public holiday calendar for %s doesn't cover %s", office, uncovered)
+        holidays = {day for year in years for day in calendar.get(year, ())}
+        office_days = weekdays[~weekdays["Date"].dt.date.isin(holidays)]
+        frames.append(office_days.assign(Office=office))
+    return pd.concat(frames, ignore_index=True)
@@ -5,20 +5,26 @@ import logging
 from src.config import (
     DB_NAME,
     DB_SERVER,
-    DB_USE_WINDOWS_AUTH,
     LEAVE_HISTORY_FILE,
     OUTPUT_FILE,
+    REGIONAL_ALLOCATIONS_FILE,
     REPORT_DATE,
+    SNAPSHOT_FILE,
 )
-from src.database import (
-    create_connection,
-    get_all_employees,
-    get_submitted_timesheets,
-    get_timesheet_exclusions,
+from src.date_utils import get_last_two_weeks, get_reporting_weeks
+from src.pipeline import ReportTarget, acquire_inputs
+from src.regional_allocations import get_employee_regions
+from src.report_diff import (
+    build_diff_sheets,
+    diff_report_keys,
+    encode_report_keys,
+    encode_week_days,
+    load_report_keys,
+    report_keys_path,
+    save_report_keys,
 )
-from src.date_utils import get_last_two_weeks
-from src.leave_parser import load_leave_history
 from src.report_generator import identify_missing_timesheets, save_report_to_excel
+from src.snapshot_builder import save_snapshot
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,51 +43,54 @@ def main() -> None:
         start_date, end_date = get_last_two_weeks(REPORT_DATE)
         logger.info("Reporting period: %s to %s", start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
 
-        # Connect to database
-        logger.info("Connecting to database: %s on %s", DB_NAME, DB_SERVER)
-        conn = create_connection(DB_SERVER, DB_NAME, DB_USE_WINDOWS_AUTH)
-        logger.info("Database connection established")
-
-        # Get employee data
-        logger.info("Retrieving employee list")
-        all_employees = get_all_employees(conn)
-        logger.info("Found %d employees", len(all_employees))
-
-        # Get exclusion list from database
-        logger.info("Retrieving timesheet exclusions")
-        exclusion_list = get_timesheet_exclusions(conn)
-        logger.info("Found %d employees on exclusion list", len(exclusion_list))
-
-        # Get submitted timesheets
-        logger.info("Retrieving submitted timesheets")
-        submitted = get_submitted_timesheets(conn, start_date, end_date)
-        logger.info("Found %d employees with submitted timesheets", len(submitted))
-
-        # Close database connection
-        conn.close()
-        logger.info("Database connection closed")
+        # Query the database and load the leave and allocation workbooks
+        target = ReportTarget(
+            DB_NAME, DB_SERVER, DB_NAME, LEAVE_HISTORY_FILE, allocations_file=REGIONAL_ALLOCATIONS_FILE
+        )
+        inputs = acquire_inputs(target, start_date, end_date)
+        exclusion_list = inputs.exclusions
+        submitted = inputs.submitted
 
-        # Load leave history
-        logger.info("Loading leave history from: %s", LEAVE_HISTORY_FILE)
-        leave_data = load_leave_history(LEAVE_HISTORY_FILE)
-        logger.info("Leave history loaded: %d records", len(leave_data))
+        all_employees = inputs.employees
+        regions = get_employee_regions(inputs.allocations) if inputs.allocations is not None else {}
 
         # Generate missing timesheet report
         logger.info("Identifying employees with missing timesheets")
         missing_df = identify_missing_timesheets(
             all_employees,
             submitted,
-            leave_data,
+            inputs.leave,
             exclusion_list,
             REPORT_DATE,
         )
         logger.info("Found %d employees with missing timesheets", len(missing_df))
 
+        # Compare against the previous run
+        keys_file = report_keys_path(OUTPUT_FILE)
+        current_keys = encode_report_keys(missing_df)
+        previous_keys = load_report_keys(keys_file)
+        diff_sheets = None
+        if previous_keys is not None:
+            week_days = encode_week_days(end.date() for _start, end in get_reporting_weeks(REPORT_DATE))
+            diff = diff_report_keys(previous_keys, current_keys, week_days)
+            diff_sheets = build_diff_sheets(diff, all_employees)
+            logger.info(
+                "Since last run: %d resolved, %d still missing, %d newly missing",
+                len(diff.resolved),
+                len(diff.still_missing),
+                len(diff.newly_missing),
+            )
+
         # Save report
         logger.info("Saving report to: %s", OUTPUT_FILE)
-        save_report_to_excel(missing_df, OUTPUT_FILE)
+        save_report_to_excel(missing_df, OUTPUT_FILE, diff_sheets)
+        save_report_keys(keys_file, current_keys)
         logger.info("Report saved successfully")
 
+        # Rebuild the snapshot used for ad-hoc queries
+        logger.info("Saving snapshot to: %s", SNAPSHOT_FILE)
+        save_snapshot(SNAPSHOT_FILE, inputs, regions, REPORT_DATE)
+
         # Display summary
         logger.info("=" * 60)
         logger.info("MISSING TIMESHEET REPORT SUMMARY")
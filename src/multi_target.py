@@ -0,0 +1,252 @@
+"""Run the missing timesheet report across several TimeTorque databases."""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+import pandas as pd
+
+from src.config import (
+    MULTI_TARGET_OUTPUT_FILE,
+    REPORT_DATE,
+    REPORT_TARGETS,
+    TARGET_DEADLINE_SECONDS,
+    TARGET_MAX_WORKERS,
+    TARGET_TIMEOUT_SECONDS,
+)
+from src.date_utils import get_last_two_weeks
+from src.pipeline import ReportTarget, acquire_inputs
+from src.report_generator import identify_missing_timesheets, save_report_to_excel
+
+logger = logging.getLogger(__name__)
+
+# How often the coordinator checks running targets against their timeouts
+_POLL_INTERVAL_SECONDS = 0.5
+
+
+@dataclass
+class TargetResult:
+    """Outcome of running the report pipeline for one target."""
+
+    target: ReportTarget
+    report: pd.DataFrame | None
+    error: str | None
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class TargetLimits:
+    """How many targets run at once and how long they may take."""
+
+    max_workers: int = TARGET_MAX_WORKERS
+    timeout: int = TARGET_TIMEOUT_SECONDS  # Per target, from when it starts
+    deadline: float = TARGET_DEADLINE_SECONDS  # For the whole run
+
+
+TargetRunner = Callable[[ReportTarget, datetime, int], pd.DataFrame]
+
+
+def run_target(target: ReportTarget, report_date: datetime, timeout: int) -> pd.DataFrame:
+    """Run acquisition and identification for a single target.
+
+    Args:
+        target: The TimeTorque instance to report on.
+        report_date: Date to calculate reporting period from.
+        timeout: Login and query timeout in seconds.
+
+    Returns:
+        DataFrame of missing timesheets for the target.
+    """
+    start_date, end_date = get_last_two_weeks(report_date)
+    inputs = acquire_inputs(target, start_date, end_date, timeout)
+    return identify_missing_timesheets(
+        inputs.employees,
+        inputs.submitted,
+        inputs.leave,
+        inputs.exclusions,
+        report_date,
+    )
+
+
+def run_targets(
+    targets: Sequence[ReportTarget],
+    report_date: datetime,
+    limits: TargetLimits | None = None,
+    runner: TargetRunner = run_target,
+) -> list[TargetResult]:
+    """Run the report pipeline for every target, a bounded number at a time.
+
+    Each target runs on its own daemon thread and its timeout is measured
+    from when it starts, so targets queued behind others are not penalised.
+    A target that overruns is abandoned and its slot handed to the next
+    queued target; its thread is left to finish on its own and can't keep
+    the interpreter alive. Targets still queued or running when the whole
+    run passes the deadline are recorded as failed.
+
+    Args:
+        targets: Targets to report on; names must be unique.
+        report_date: Date to calculate reporting period from.
+        limits: Concurrency and timeouts; defaults to the configured limits.
+        runner: Function producing the report for one target.
+
+    Returns:
+        One TargetResult per target, in the order the targets were given.
+
+    Raises:
+        ValueError: If target names are not unique.
+    """
+    names = [target.name for target in targets]
+    if len(set(names)) != len(names):
+        msg = f"Target names must be unique: {names}"
+        raise ValueError(msg)
+
+    limits = limits or TargetLimits()
+    max_workers, timeout, deadline = limits.max_workers, limits.timeout, limits.deadline
+    finished: queue.SimpleQueue[TargetResult] = queue.SimpleQueue()
+    queued = deque(targets)
+    running: dict[str, tuple[ReportTarget, float]] = {}
+    results: dict[str, TargetResult] = {}
+    run_deadline = time.monotonic() + deadline
+
+    while queued or running:
+        while queued and len(running) < max_workers:
+            target = queued.popleft()
+            running[target.name] = (target, time.monotonic())
+            worker = threading.Thread(
+                target=_run_worker,
+                args=(runner, target, report_date, timeout, finished),
+                name=f"target-{target.name}",
+                daemon=True,
+            )
+            worker.start()
+
+        try:
+            result = finished.get(timeout=_POLL_INTERVAL_SECONDS)
+        except queue.Empty:
+            pass
+        else:
+            # Results from abandoned targets arrive after they were recorded as timed out
+            if running.pop(result.target.name, None) is not None:
+                results[result.target.name] = result
+
+        now = time.monotonic()
+        for target, target_start in list(running.values()):
+            if now - target_start > timeout:
+                del running[target.name]
+                logger.error("Target %s timed out after %ds", target.name, timeout)
+                results[target.name] = TargetResult(target, None, f"Timed out after {timeout}s", now - target_start)
+
+        if now > run_deadline:
+            _fail_unfinished(queued, running, results, now, deadline)
+            break
+
+    return [results[name] for name in names]
+
+
+def _run_worker(
+    runner: TargetRunner,
+    target: ReportTarget,
+    report_date: datetime,
+    timeout: int,
+    finished: queue.SimpleQueue[TargetResult],
+) -> None:
+    """Run one target and put its TargetResult on the finished queue.
+
+    Args:
+        runner: Function producing the report for the target.
+        target: The target to run.
+        report_date: Date to calculate reporting period from.
+        timeout: Login and query timeout in seconds.
+        finished: Queue the result is reported on.
+    """
+    started = time.monotonic()
+    try:
+        report = runner(target, report_date, timeout)
+    except Exception as e:
+        logger.exception("Target %s failed", target.name)
+        finished.put(TargetResult(target, None, str(e) or type(e).__name__, time.monotonic() - started))
+        return
+
+    elapsed = time.monotonic() - started
+    logger.info("Target %s finished in %.1fs: %d missing timesheets", target.name, elapsed, len(report))
+    finished.put(TargetResult(target, report, None, elapsed))
+
+
+def _fail_unfinished(
+    queued: deque[ReportTarget],
+    running: dict[str, tuple[ReportTarget, float]],
+    results: dict[str, TargetResult],
+    now: float,
+    deadline: float,
+) -> None:
+    """Record every target still queued or running as failed at the run deadline.
+
+    Args:
+        queued: Targets that never started.
+        running: Running targets with their start times.
+        results: Results by target name, updated in place.
+        now: Current monotonic time.
+        deadline: The run deadline in seconds, for the error message.
+    """
+    for target, target_start in running.values():
+        logger.error("Target %s still running at the %gs run deadline", target.name, deadline)
+        results[target.name] = TargetResult(target, None, f"Run deadline of {deadline:g}s exceeded", now - target_start)
+    for target in queued:
+        logger.error("Target %s not started before the %gs run deadline", target.name, deadline)
+        results[target.name] = TargetResult(target, None, f"Not started before the {deadline:g}s run deadline", 0.0)
+
+
+def merge_target_reports(results: Sequence[TargetResult]) -> pd.DataFrame:
+    """Combine successful target reports into one report with a Target column.
+
+    Args:
+        results: Results returned by run_targets.
+
+    Returns:
+        DataFrame with a leading Target column followed by the report columns.
+    """
+    frames = [
+        result.report.assign(Target=result.target.name)
+        for result in results
+        if result.report is not None and not result.report.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["Target", "Employee ID", "First Name", "Last Name", "Week Ending"])
+
+    merged = pd.concat(frames, ignore_index=True)
+    return merged[["Target", *[col for col in merged.columns if col != "Target"]]]
+
+
+def main() -> None:
+    """Execute the missing timesheet report for every configured target."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    targets = [ReportTarget(*entry) for entry in REPORT_TARGETS]
+    logger.info("Running report for %d targets", len(targets))
+
+    results = run_targets(targets, REPORT_DATE)
+    merged = merge_target_reports(results)
+
+    logger.info("Saving report to: %s", MULTI_TARGET_OUTPUT_FILE)
+    save_report_to_excel(merged, MULTI_TARGET_OUTPUT_FILE)
+
+    logger.info("=" * 60)
+    for result in results:
+        status = f"{len(result.report)} missing" if result.report is not None else f"FAILED ({result.error})"
+        logger.info("%s: %s [%.1fs]", result.target.name, status, result.elapsed)
+    logger.info("=" * 60)
+
+    failed = [result.target.name for result in results if result.error is not None]
+    if failed:
+        logger.warning("Targets without results: %s", ", ".join(failed))
+
+
+if __name__ == "__main__":
+    main()
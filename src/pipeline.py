@@ -0,0 +1,169 @@
+"""Data acquisition pipeline shared by the report entry points."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+import pandas as pd
+
+from src.config import DB_USE_WINDOWS_AUTH
+from src.leave_parser import load_leave_history
+from src.regional_allocations import (
+    get_employee_offices,
+    get_partial_timesheet_ids,
+    load_regional_allocations,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReportTarget:
+    """A TimeTorque instance and the inputs specific to it."""
+
+    name: str
+    server: str
+    database: str
+    leave_file: str
+    exclusions: frozenset[int] = frozenset()
+    allocations_file: str | None = None  # Regional people allocations workbook, if any
+
+
+@dataclass
+class ReportInputs:
+    """Container for the data sources a report run is built from."""
+
+    employees: pd.DataFrame
+    exclusions: frozenset[int]
+    submitted: pd.DataFrame
+    leave: pd.DataFrame
+    allocations: pd.DataFrame | None = None  # Normalised regional allocations, when available
+
+
+def acquire_inputs(
+    target: ReportTarget,
+    start_date: datetime,
+    end_date: datetime,
+    timeout: int = 0,
+) -> ReportInputs:
+    """Query TimeTorque and load the leave and allocation workbooks for one period.
+
+    Args:
+        target: The TimeTorque instance and workbooks to load.
+        start_date: Start of reporting period.
+        end_date: End of reporting period.
+        timeout: Login and query timeout in seconds (0 waits indefinitely).
+
+    Returns:
+        ReportInputs holding employees, exclusions, submissions, leave and
+        allocations. The exclusions combine the database list with the target's own,
+        and the employees carry PartialTimesheet and Office columns (see
+        mark_partial_timesheets and mark_offices).
+
+    Raises:
+        pyodbc.Error: If the connection or a query fails.
+        FileNotFoundError: If the leave history file doesn't exist.
+        ValueError: If the leave history file format is invalid.
+    """
+    # Imported here so the report and service modules load without an ODBC driver
+    from src import database
+
+    logger.info("Connecting to database: %s on %s", target.database, target.server)
+    conn = database.create_connection(target.server, target.database, DB_USE_WINDOWS_AUTH, timeout)
+    logger.info("Database connection established")
+
+    try:
+        logger.info("Retrieving employee list")
+        employees = database.get_all_employees(conn)
+        logger.info("Found %d employees", len(employees))
+
+        logger.info("Retrieving timesheet exclusions")
+        exclusions = database.get_timesheet_exclusions(conn) | target.exclusions
+        logger.info("Found %d employees on exclusion list", len(exclusions))
+
+        logger.info("Retrieving submitted timesheets")
+        submitted = database.get_submitted_timesheets(conn, start_date, end_date)
+        logger.info("Found %d employees with submitted timesheets", len(submitted))
+    finally:
+        conn.close()
+        logger.info("Database connection closed")
+
+    leave, allocations = load_workbooks(target.leave_file, target.allocations_file)
+    employees = mark_offices(mark_partial_timesheets(employees, allocations), allocations)
+
+    return ReportInputs(
+        employees=employees,
+        exclusions=exclusions,
+        submitted=submitted,
+        leave=leave,
+        allocations=allocations,
+    )
+
+
+def load_workbooks(leave_file: str, allocations_file: str | None) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Load the leave history and regional allocations workbooks.
+
+    The two sheets are small, so they are read one after the other; worker
+    processes (see excel_ingest.read_sheets) would cost more to start than
+    the reads take. The regional allocations are optional: if they can't be
+    read, a warning is logged and the report runs without them.
+
+    Args:
+        leave_file: Path to the leave history Excel file.
+        allocations_file: Path to the regional people allocations Excel
+            file, or None to skip it.
+
+    Returns:
+        Tuple of (leave history, normalised allocations or None).
+
+    Raises:
+        FileNotFoundError: If the leave history file doesn't exist.
+        ValueError: If the leave history file format is invalid.
+    """
+    logger.info("Loading leave history from: %s", leave_file)
+    leave = load_leave_history(leave_file)
+    logger.info("Leave history loaded: %d records", len(leave))
+
+    allocations = None
+    if allocations_file is not None:
+        logger.info("Loading regional allocations from: %s", allocations_file)
+        try:
+            allocations = load_regional_allocations(allocations_file)
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning("Regional allocations unavailable: %s", e)
+
+    return leave, allocations
+
+
+def mark_partial_timesheets(employees: pd.DataFrame, allocations: pd.DataFrame | None) -> pd.DataFrame:
+    """Add the PartialTimesheet column the eligibility rules read.
+
+    Partial-timesheet employees still owe a timesheet for weeks they spend
+    on leave. Without allocations, nobody is marked.
+
+    Args:
+        employees: DataFrame of employees with an EmployeeID column.
+        allocations: Normalised regional allocations, or None.
+
+    Returns:
+        Copy of employees with a boolean PartialTimesheet column.
+    """
+    partial_ids = get_partial_timesheet_ids(allocations) if allocations is not None else frozenset[int]()
+    return employees.assign(PartialTimesheet=employees["EmployeeID"].astype(int).isin(partial_ids))
+
+
+def mark_offices(employees: pd.DataFrame, allocations: pd.DataFrame | None) -> pd.DataFrame:
+    """Add the Office column that picks each employee's public holidays.
+
+    Employees missing from the allocations, or all of them without
+    allocations, get an empty office.
+
+    Args:
+        employees: DataFrame of employees with an EmployeeID column.
+        allocations: Normalised regional allocations, or None.
+
+    Returns:
+        Copy of employees with a string Office column.
+    """
+    offices = get_employee_offices(allocations) if allocations is not None else {}
+    return employees.assign(Office=employees["EmployeeID"].astype(int).map(offices).fillna("").astype(str))
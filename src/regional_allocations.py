@@ -0,0 +1,121 @@
+"""Parse the regional people allocations workbook."""
+
+import pandas as pd
+
+from src.excel_ingest import SheetSpec, read_sheet
+
+REGIONAL_SHEET_NAME = "Regional allocations LIVE"
+REGIONAL_HEADER_ROW = 2  # Headers are on row 3
+
+EMPLOYEE_ID_COLUMN = "Employee ID"
+REGION_COLUMN = "Current Region"
+OFFICE_COLUMN = "Office"  # Picks the public holiday calendar
+TIMESHEET_COLUMN = "Timesheet?"
+PARTIAL_COLUMN = "Partial? "  # Header has a trailing space in the workbook
+
+
+def load_regional_allocations(file_path: str) -> pd.DataFrame:
+    """Load employee region and timesheet flags from the allocations workbook.
+
+    Rows without an Employee ID (e.g. people not yet in TimeTorque) are dropped.
+
+    Args:
+        file_path: Path to the regional people allocations Excel file.
+
+    Returns:
+        DataFrame with columns: EmployeeID, Region, Office, Timesheet, Partial.
+        Timesheet and Partial are booleans parsed from the Y/N flags.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        ValueError: If file format is invalid.
+    """
+    return normalise_regional_allocations(read_sheet(regional_allocations_spec(file_path)))
+
+
+def regional_allocations_spec(file_path: str) -> SheetSpec:
+    """Describe the regional allocation columns to read from the workbook.
+
+    Args:
+        file_path: Path to the regional people allocations Excel file.
+
+    Returns:
+        SheetSpec for the allocations sheet, headers on row 3.
+    """
+    return SheetSpec(
+        file_path=file_path,
+        sheet_name=REGIONAL_SHEET_NAME,
+        header_row=REGIONAL_HEADER_ROW,
+        columns=(EMPLOYEE_ID_COLUMN, REGION_COLUMN, OFFICE_COLUMN, TIMESHEET_COLUMN, PARTIAL_COLUMN),
+        dtypes=((EMPLOYEE_ID_COLUMN, "Int64"),),
+    )
+
+
+def normalise_regional_allocations(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert raw allocation columns into typed report columns.
+
+    Args:
+        df: DataFrame with the raw workbook column headers.
+
+    Returns:
+        DataFrame with columns: EmployeeID, Region, Office, Timesheet, Partial.
+    """
+    df = df.dropna(subset=[EMPLOYEE_ID_COLUMN])
+    return pd.DataFrame(
+        {
+            "EmployeeID": df[EMPLOYEE_ID_COLUMN].astype(int),
+            "Region": df[REGION_COLUMN].fillna("").astype(str).str.strip(),
+            "Office": df[OFFICE_COLUMN].fillna("").astype(str).str.strip(),
+            "Timesheet": _is_yes(df[TIMESHEET_COLUMN]),
+            "Partial": _is_yes(df[PARTIAL_COLUMN]),
+        }
+    ).reset_index(drop=True)
+
+
+def get_employee_regions(allocations: pd.DataFrame) -> dict[int, str]:
+    """Map employee IDs to their current region.
+
+    Args:
+        allocations: DataFrame returned by load_regional_allocations.
+
+    Returns:
+        Dictionary mapping employee ID to region name.
+    """
+    return dict(zip(allocations["EmployeeID"].tolist(), allocations["Region"].tolist(), strict=True))
+
+
+def get_employee_offices(allocations: pd.DataFrame) -> dict[int, str]:
+    """Map employee IDs to their office.
+
+    Args:
+        allocations: DataFrame returned by load_regional_allocations.
+
+    Returns:
+        Dictionary mapping employee ID to office name.
+    """
+    return dict(zip(allocations["EmployeeID"].tolist(), allocations["Office"].tolist(), strict=True))
+
+
+def get_partial_timesheet_ids(allocations: pd.DataFrame) -> frozenset[int]:
+    """Get employees who submit partial timesheets even when on leave.
+
+    Args:
+        allocations: DataFrame returned by load_regional_allocations.
+
+    Returns:
+        Frozenset of employee IDs with Timesheet? = Y and Partial? = Y.
+    """
+    flagged = allocations[allocations["Timesheet"] & allocations["Partial"]]
+    return frozenset(flagged["EmployeeID"].astype(int).tolist())
+
+
+def _is_yes(values: pd.Series) -> pd.Series:
+    """Check which Y/N flag values are set.
+
+    Args:
+        values: Series of Y/N flags (case-insensitive, may contain blanks).
+
+    Returns:
+        Boolean Series, True where the flag is Y.
+    """
+    return values.fillna("").astype(str).str.strip().str.upper() == "Y"
@@ -0,0 +1,167 @@
+"""In-memory report state shared by concurrent service requests."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+from src.date_utils import get_last_two_weeks
+from src.report_generator import identify_missing_timesheets
+
+logger = logging.getLogger(__name__)
+
+# Number of recent request latencies kept for percentile metrics
+LATENCY_SAMPLES = 1000
+
+
+@dataclass
+class ReportState:
+    """Data loaded from TimeTorque and Excel that reports are computed from."""
+
+    employees: pd.DataFrame
+    exclusions: frozenset[int]
+    submitted: pd.DataFrame
+    leave: pd.DataFrame
+    regions: dict[int, str]
+    window_start: datetime
+    window_end: datetime
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class ServiceMetrics:
+    """Request latency and refresh counters."""
+
+    requests: int = 0
+    errors: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    last_refresh_seconds: float | None = None
+    latencies: deque[float] = field(default_factory=lambda: deque[float](maxlen=LATENCY_SAMPLES))
+
+    def record_request(self, seconds: float, failed: bool) -> None:
+        """Record one served request.
+
+        Args:
+            seconds: Time taken to serve the request.
+            failed: Whether the request ended in an error response.
+        """
+        self.requests += 1
+        self.errors += failed
+        self.latencies.append(seconds)
+
+    def latency_summary(self) -> dict[str, float | None]:
+        """Summarise recent request latencies in milliseconds.
+
+        Returns:
+            Dictionary with p50, p95 and max latency, None when no requests.
+        """
+        if not self.latencies:
+            return {"p50_ms": None, "p95_ms": None, "max_ms": None}
+        ordered = sorted(self.latencies)
+        return {
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+
+class ReportCache:
+    """Holds the loaded report state and refreshes it without duplicate loads.
+
+    All concurrent callers that need a refresh await the same in-flight load,
+    so a burst of requests against a cold or stale cache queries TimeTorque
+    once. Computed reports are memoised per reporting period until the next
+    refresh.
+    """
+
+    def __init__(self, loader: Callable[[], ReportState], refresh_interval: float):
+        self._loader = loader
+        self._refresh_interval = refresh_interval
+        self._state: ReportState | None = None
+        self._inflight: asyncio.Task[ReportState] | None = None
+        self._reports: dict[datetime, pd.DataFrame] = {}
+        self.metrics = ServiceMetrics()
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the state was loaded, or None if never loaded."""
+        return None if self._state is None else time.monotonic() - self._state.loaded_at
+
+    async def get(self) -> ReportState:
+        """Get the current state, loading it first if the cache is empty.
+
+        Returns:
+            The cached report state.
+        """
+        if self._state is None:
+            return await self.refresh()
+        return self._state
+
+    async def refresh(self) -> ReportState:
+        """Reload the state, joining a refresh that is already running.
+
+        Returns:
+            The newly loaded report state.
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._load())
+        # Shield so one cancelled caller doesn't cancel the load for everyone
+        return await asyncio.shield(self._inflight)
+
+    async def _load(self) -> ReportState:
+        started = time.perf_counter()
+        try:
+            state = await asyncio.to_thread(self._loader)
+        except Exception:
+            self.metrics.refresh_failures += 1
+            raise
+        finally:
+            self._inflight = None
+
+        self._state = state
+        self._reports.clear()
+        self.metrics.refreshes += 1
+        self.metrics.last_refresh_seconds = time.perf_counter() - started
+        logger.info("Report state refreshed in %.1fs", self.metrics.last_refresh_seconds)
+        return state
+
+    async def run_scheduled_refresh(self) -> None:
+        """Refresh the state every refresh interval until cancelled."""
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Scheduled refresh failed; keeping previous state")
+
+    async def missing_timesheets(self, report_date: datetime) -> pd.DataFrame:
+        """Get the missing timesheet report for a date from the cached state.
+
+        Args:
+            report_date: Date to calculate reporting period from.
+
+        Returns:
+            DataFrame with employees missing timesheets.
+        """
+        state = await self.get()
+        key = get_last_two_weeks(report_date)[0].replace(tzinfo=None)
+        report = self._reports.get(key)
+        if report is None:
+            report = await asyncio.to_thread(
+                identify_missing_timesheets,
+                state.employees,
+                state.submitted,
+                state.leave,
+                state.exclusions,
+                report_date,
+            )
+            # Only memoise against the state the report was computed from
+            if self._state is state:
+                self._reports[key] = report
+        return report
@@ -0,0 +1,178 @@
+"""Compare a report run against the previous run's missing timesheets.
+
+Each report row is reduced to a single int64 key, the employee ID in the
+high 32 bits and the week ending as days since 1970-01-01 in the low 32
+bits. The keys of each run are stored as a sorted array next to the report,
+so the next run can compute resolved, still-missing and newly-missing rows
+with sorted set operations instead of comparing spreadsheets.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+KeyArray = npt.NDArray[np.int64]
+
+WEEK_FORMAT = "%d/%m/%y"
+KEYS_SUFFIX = ".keys.npy"
+
+_DAY_BITS = 32
+_DAY_MASK = (1 << _DAY_BITS) - 1
+_EPOCH = pd.Timestamp(1970, 1, 1)
+
+
+@dataclass
+class ReportDiff:
+    """Keys that changed between two report runs."""
+
+    resolved: KeyArray
+    still_missing: KeyArray
+    newly_missing: KeyArray
+
+
+def report_keys_path(output_path: str | Path) -> Path:
+    """Get the file the report's keys are stored in.
+
+    Args:
+        output_path: Path of the Excel report.
+
+    Returns:
+        Path alongside the report with the keys suffix.
+    """
+    output = Path(output_path)
+    return output.with_name(output.stem + KEYS_SUFFIX)
+
+
+def encode_report_keys(missing_df: pd.DataFrame) -> KeyArray:
+    """Encode report rows as sorted, unique (employee, week ending) keys.
+
+    Args:
+        missing_df: Report with Employee ID and Week Ending (DD/MM/YY) columns.
+
+    Returns:
+        Sorted int64 array of keys.
+    """
+    if missing_df.empty:
+        return np.empty(0, dtype=np.int64)
+
+    employee_ids = missing_df["Employee ID"].to_numpy(dtype=np.int64)
+    week_ends = pd.to_datetime(missing_df["Week Ending"], format=WEEK_FORMAT)
+    days = ((week_ends - _EPOCH).dt.days).to_numpy(dtype=np.int64)
+    return np.unique((employee_ids << _DAY_BITS) | days)
+
+
+def encode_week_days(week_ends: Iterable[date]) -> KeyArray:
+    """Encode week ending dates the same way as the low bits of a key.
+
+    Args:
+        week_ends: Week ending dates.
+
+    Returns:
+        Sorted int64 array of days since 1970-01-01.
+    """
+    return np.unique(np.array([(pd.Timestamp(week_end) - _EPOCH).days for week_end in week_ends], dtype=np.int64))
+
+
+def decode_report_keys(keys: KeyArray, employees: pd.DataFrame) -> pd.DataFrame:
+    """Turn keys back into report rows, looking up employee names.
+
+    Args:
+        keys: Keys to decode.
+        employees: DataFrame with EmployeeID, FirstName and LastName columns.
+
+    Returns:
+        DataFrame with the report columns, sorted by week ending then
+        Employee ID. Names are blank for employees no longer listed.
+    """
+    week_ends = _EPOCH + pd.to_timedelta(keys & _DAY_MASK, unit="D")
+    rows = pd.DataFrame({"Employee ID": keys >> _DAY_BITS, "_sort_date": week_ends})
+    names = employees[["EmployeeID", "FirstName", "LastName"]].drop_duplicates("EmployeeID")
+    names = names.rename(columns={"EmployeeID": "Employee ID", "FirstName": "First Name", "LastName": "Last Name"})
+    names["Employee ID"] = names["Employee ID"].astype(np.int64)
+
+    rows = rows.merge(names, on="Employee ID", how="left")
+    rows[["First Name", "Last Name"]] = rows[["First Name", "Last Name"]].fillna("")
+    rows["Week Ending"] = rows["_sort_date"].dt.strftime(WEEK_FORMAT)
+    rows = rows.sort_values(["_sort_date", "Employee ID"]).reset_index(drop=True)
+    return rows[["Employee ID", "First Name", "Last Name", "Week Ending"]]
+
+
+def diff_report_keys(previous: KeyArray, current: KeyArray, week_days: KeyArray | None = None) -> ReportDiff:
+    """Compare the previous run's keys with the current run's.
+
+    Args:
+        previous: Sorted, unique keys from the previous run.
+        current: Sorted, unique keys from the current run.
+        week_days: Weeks covered by the current run (see encode_week_days).
+            Previous keys for other weeks are ignored, so weeks that have
+            rolled out of the reporting period are not counted as resolved.
+
+    Returns:
+        ReportDiff of resolved, still-missing and newly-missing keys.
+    """
+    if week_days is not None:
+        previous = previous[np.isin(previous & _DAY_MASK, week_days)]
+
+    return ReportDiff(
+        resolved=np.setdiff1d(previous, current, assume_unique=True),
+        still_missing=np.intersect1d(previous, current, assume_unique=True),
+        newly_missing=np.setdiff1d(current, previous, assume_unique=True),
+    )
+
+
+def load_report_keys(path: str | Path) -> KeyArray | None:
+    """Load the keys saved by a previous run.
+
+    Args:
+        path: Keys file written by save_report_keys.
+
+    Returns:
+        Sorted int64 array of keys, or None if there was no previous run.
+    """
+    keys_file = Path(path)
+    if not keys_file.exists():
+        return None
+    return np.load(keys_file, allow_pickle=False).astype(np.int64, copy=False)
+
+
+def save_report_keys(path: str | Path, keys: KeyArray) -> None:
+    """Save the current run's keys for the next run to compare against.
+
+    Args:
+        path: Keys file to write.
+        keys: Sorted, unique keys for the current run.
+    """
+    keys_file = Path(path)
+    temp_path = keys_file.with_name(keys_file.name + ".tmp")
+    with temp_path.open("wb") as f:
+        np.save(f, keys, allow_pickle=False)
+    temp_path.replace(keys_file)
+
+
+def build_diff_sheets(diff: ReportDiff, employees: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Build the extra report sheets describing the changes since the last run.
+
+    Args:
+        diff: Result of diff_report_keys.
+        employees: DataFrame with EmployeeID, FirstName and LastName columns.
+
+    Returns:
+        Mapping of sheet name to DataFrame, starting with a summary sheet.
+    """
+    summary = pd.DataFrame(
+        {
+            "Status": ["Resolved", "Still Missing", "Newly Missing"],
+            "Count": [len(diff.resolved), len(diff.still_missing), len(diff.newly_missing)],
+        }
+    )
+    return {
+        "Changes Summary": summary,
+        "Newly Missing": decode_report_keys(diff.newly_missing, employees),
+        "Still Missing": decode_report_keys(diff.still_missing, employees),
+        "Resolved": decode_report_keys(diff.resolved, employees),
+    }
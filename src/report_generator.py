@@ -1,95 +1,116 @@
 """Generate missing timesheet reports."""
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import logging
+from collections.abc import Mapping
+from datetime import datetime
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
-from src.date_utils import get_last_two_weeks
+from src.date_utils import get_reporting_weeks
+from src.eligibility_rules import DEFAULT_RULES, RuleSet, RuleStats
+from src.leave_parser import get_full_week_leave
 
+logger = logging.getLogger(__name__)
 
-@dataclass
-class WeekRanges:
-    """Container for week date ranges."""
+REPORT_COLUMNS = ["Employee ID", "First Name", "Last Name", "Week Ending"]
 
-    week1_start: datetime
-    week1_end: datetime
-    week2_start: datetime
-    week2_end: datetime
+_DEFAULT_RULE_SET = RuleSet(DEFAULT_RULES)
 
 
-def _build_submitted_weeks_dict(
+def build_employee_week_matrix(
+    all_employees: pd.DataFrame,
     submitted_employees: pd.DataFrame,
-    weeks: WeekRanges,
-) -> dict[int, set[str]]:
-    """Build dictionary of submitted weeks by employee.
+    leave_df: pd.DataFrame,
+    exclusion_list: frozenset[int],
+    report_date: datetime,
+) -> pd.DataFrame:
+    """Build one row per employee per reporting week with the rule inputs.
+
+    Dates are compared as whole days, without time of day or timezone.
 
     Args:
+        all_employees: DataFrame of all employees. An optional boolean
+            PartialTimesheet column marks employees who submit partial
+            timesheets while on leave, and an optional Office column picks
+            their public holidays.
         submitted_employees: DataFrame with EmployeeID and DatePeriod.
-        weeks: Week date ranges.
+        leave_df: DataFrame of leave history.
+        exclusion_list: Set of employee IDs to exclude from report.
+        report_date: Date to calculate reporting period from.
 
     Returns:
-        Dictionary mapping employee ID to set of week ending dates.
+        DataFrame with columns EmployeeID, FirstName, LastName, StartDate,
+        WeekStart, WeekEnd, Excluded, Submitted, FullWeekLeave and
+        PartialTimesheet.
     """
-    # Convert week ranges to naive datetime for comparison
-    week1_start_naive = weeks.week1_start.replace(tzinfo=None)
-    week1_end_naive = weeks.week1_end.replace(tzinfo=None)
-    week2_start_naive = weeks.week2_start.replace(tzinfo=None)
-    week2_end_naive = weeks.week2_end.replace(tzinfo=None)
-
-    submitted_by_employee: dict[int, set[str]] = {}
-    for _, row in submitted_employees.iterrows():
-        emp_id = int(row["EmployeeID"])
-
-        # Get date period as Python datetime, removing timezone if present
-        date_val = row["DatePeriod"]
-        date_period = date_val.to_pydatetime() if hasattr(date_val, "to_pydatetime") else date_val
-
-        if hasattr(date_period, "replace"):
-            date_period = date_period.replace(tzinfo=None)
-
-        if emp_id not in submitted_by_employee:
-            submitted_by_employee[emp_id] = set()
-
-        # Determine which week this timesheet belongs to and store week ending date
-        if week1_start_naive <= date_period <= week1_end_naive:
-            submitted_by_employee[emp_id].add(weeks.week1_end.strftime("%d/%m/%y"))
-        elif week2_start_naive <= date_period <= week2_end_naive:
-            submitted_by_employee[emp_id].add(weeks.week2_end.strftime("%d/%m/%y"))
+    week_starts = [start.replace(tzinfo=None) for start, _end in get_reporting_weeks(report_date)]
+    weeks = pd.DataFrame({"WeekStart": pd.DatetimeIndex(week_starts).normalize().astype("datetime64[ns]")})
+    weeks["WeekEnd"] = weeks["WeekStart"] + pd.Timedelta(days=6)
+
+    employee_ids = all_employees["EmployeeID"].astype("int64")
+    partial = all_employees["PartialTimesheet"] if "PartialTimesheet" in all_employees.columns else False
+    employees = pd.DataFrame(
+        {
+            "EmployeeID": employee_ids,
+            "FirstName": all_employees["FirstName"].astype(str),
+            "LastName": all_employees["LastName"].astype(str),
+            "StartDate": _naive_days(all_employees["StartDate"]),
+            "Excluded": employee_ids.isin(exclusion_list),
+            "PartialTimesheet": pd.Series(partial, index=all_employees.index).fillna(value=False).astype(bool),
+        }
+    )
+    matrix = employees.merge(weeks, how="cross")
 
-    return submitted_by_employee
+    submitted_keys = pd.DataFrame(
+        {
+            "EmployeeID": submitted_employees["EmployeeID"].astype("int64"),
+            "WeekStart": _week_start_of(_naive_days(submitted_employees["DatePeriod"])),
+        }
+    )
+    matrix["Submitted"] = _has_key(matrix, submitted_keys)
+    offices = (
+        dict(zip(employee_ids.tolist(), all_employees["Office"].fillna("").astype(str).tolist(), strict=True))
+        if "Office" in all_employees.columns
+        else None
+    )
+    matrix["FullWeekLeave"] = _has_key(matrix, get_full_week_leave(leave_df, week_starts, offices))
+    return matrix
 
 
-def _get_missing_weeks_for_employee(
-    submitted_weeks: set[str],
-    weeks: WeekRanges,
-) -> list[str]:
-    """Determine which weeks are missing for an employee.
+def evaluate_missing_timesheets(
+    matrix: pd.DataFrame,
+    rules: RuleSet = _DEFAULT_RULE_SET,
+) -> tuple[pd.DataFrame, list[RuleStats]]:
+    """Apply eligibility rules to an employee-week matrix and format the report.
 
     Args:
-        submitted_weeks: Set of week ending dates with submitted timesheets.
-        weeks: Week date ranges.
+        matrix: DataFrame returned by build_employee_week_matrix.
+        rules: Rules deciding which employee-weeks are not reportable.
 
     Returns:
-        List of missing week ending dates formatted as DD/MM/YY.
+        Tuple of (report DataFrame, per-rule stats).
     """
-    # Check which weeks are missing
-    missing_weeks = []
-    week1_end_str = weeks.week1_end.strftime("%d/%m/%y")
-    week2_end_str = weeks.week2_end.strftime("%d/%m/%y")
-
-    if week1_end_str not in submitted_weeks:
-        missing_weeks.append(week1_end_str)
-    if week2_end_str not in submitted_weeks:
-        missing_weeks.append(week2_end_str)
-
-    return missing_weeks
+    keep, stats = rules.evaluate(matrix)
+    missing = matrix[keep].sort_values(["WeekEnd", "EmployeeID"], kind="stable")
+
+    report = pd.DataFrame(
+        {
+            "Employee ID": missing["EmployeeID"].to_numpy(dtype=np.int64),
+            "First Name": missing["FirstName"].to_numpy(),
+            "Last Name": missing["LastName"].to_numpy(),
+            "Week Ending": missing["WeekEnd"].dt.strftime("%d/%m/%y").to_numpy(),
+        },
+        columns=REPORT_COLUMNS,
+    )
+    return report, stats
 
 
 def identify_missing_timesheets(
     all_employees: pd.DataFrame,
     submitted_employees: pd.DataFrame,
-    _leave_df: pd.DataFrame,
+    leave_df: pd.DataFrame,
     exclusion_list: frozenset[int],
     report_date: datetime,
 ) -> pd.DataFrame:
@@ -98,96 +119,60 @@ def identify_missing_timesheets(
     Args:
         all_employees: DataFrame of all employees.
         submitted_employees: DataFrame of employees who submitted timesheets.
-        _leave_df: DataFrame of leave history (reserved for future use).
+        leave_df: DataFrame of leave history.
         exclusion_list: Set of employee IDs to exclude from report.
         report_date: Date to calculate reporting period from.
 
     Returns:
         DataFrame with employees missing timesheets and which weeks are missing.
     """
-    # Get date range for reporting period (last two complete weeks)
-    _start_date, end_date = get_last_two_weeks(report_date)
-
-    # Calculate individual week ranges
-    # Week 2 (most recent): Friday to Thursday
-    week2_end = end_date
-    week2_start = week2_end - timedelta(days=6)
-
-    # Week 1 (previous week): Friday to Thursday
-    week1_end = week2_start - timedelta(days=1)
-    week1_start = week1_end - timedelta(days=6)
-
-    weeks = WeekRanges(
-        week1_start=week1_start,
-        week1_end=week1_end,
-        week2_start=week2_start,
-        week2_end=week2_end,
-    )
-
-    # Build dictionary of submitted timesheets by employee
-    submitted_by_employee = _build_submitted_weeks_dict(submitted_employees, weeks)
-
-    missing_list: list[dict[str, int | str]] = []
-
-    for _, employee in all_employees.iterrows():
-        emp_id = int(employee["EmployeeID"])
-
-        # Skip if on exclusion list
-        if emp_id in exclusion_list:
-            continue
-
-        # Skip if employee start date is after the week start
-        start_date_val = employee["StartDate"]
-        if pd.notna(start_date_val):
-            emp_start = pd.to_datetime(start_date_val)
-            if hasattr(emp_start, "replace"):
-                emp_start = emp_start.replace(tzinfo=None)
-            if emp_start > weeks.week1_start.replace(tzinfo=None):
-                continue
-
-        # Check which weeks have timesheets
-        submitted_weeks = submitted_by_employee.get(emp_id, set())
-
-        # Get missing weeks for this employee
-        missing_weeks = _get_missing_weeks_for_employee(submitted_weeks, weeks)
-
-        # Add a separate row for each missing week
-        # Store both the formatted string and a date object for sorting
-        for i, week_ending in enumerate(missing_weeks):
-            # Determine which week this is for sorting
-            week_date = weeks.week1_end if i == 0 and week_ending == weeks.week1_end.strftime("%d/%m/%y") else weeks.week2_end
-            if week_ending == weeks.week2_end.strftime("%d/%m/%y"):
-                week_date = weeks.week2_end
-            else:
-                week_date = weeks.week1_end
-
-            missing_list.append(
-                {
-                    "Employee ID": emp_id,
-                    "First Name": str(employee["FirstName"]),
-                    "Last Name": str(employee["LastName"]),
-                    "Week Ending": week_ending,
-                    "_sort_date": week_date,
-                }
-            )
-
-    # Create and sort DataFrame
-    missing_df = pd.DataFrame(missing_list)
-
-    if not missing_df.empty:
-        # Sort by week ending date (least recent to most recent), then by Employee ID
-        missing_df = missing_df.sort_values(["_sort_date", "Employee ID"]).reset_index(drop=True)
-        # Remove the temporary sort column
-        missing_df = missing_df.drop(columns=["_sort_date"])
-
-    return missing_df
-
-
-def save_report_to_excel(df: pd.DataFrame, output_path: str) -> None:
+    matrix = build_employee_week_matrix(all_employees, submitted_employees, leave_df, exclusion_list, report_date)
+    report, stats = evaluate_missing_timesheets(matrix)
+    for rule_stats in stats:
+        logger.info(
+            "Rule %s removed %d of %d employee-weeks (%.2f ms)",
+            rule_stats.name,
+            rule_stats.removed,
+            len(matrix),
+            rule_stats.seconds * 1000,
+        )
+    return report
+
+
+def _naive_days(values: pd.Series) -> pd.Series:
+    """Convert dates to timezone-naive midnight timestamps."""
+    dates = pd.to_datetime(values, errors="coerce")
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.dt.normalize().astype("datetime64[ns]")
+
+
+def _week_start_of(dates: pd.Series) -> pd.Series:
+    """Get the Friday that starts each date's Friday-Thursday week."""
+    return dates - pd.to_timedelta((dates.dt.dayofweek - 4) % 7, unit="D")
+
+
+def _has_key(matrix: pd.DataFrame, keys: pd.DataFrame) -> npt.NDArray[np.bool_]:
+    """Check which matrix rows have an (EmployeeID, WeekStart) pair in keys."""
+    if keys.empty:
+        return np.zeros(len(matrix), dtype=np.bool_)
+    index = pd.MultiIndex.from_frame(keys[["EmployeeID", "WeekStart"]].dropna().astype({"EmployeeID": "int64"}))
+    return pd.MultiIndex.from_frame(matrix[["EmployeeID", "WeekStart"]]).isin(index)
+
+
+def save_report_to_excel(
+    df: pd.DataFrame,
+    output_path: str,
+    extra_sheets: Mapping[str, pd.DataFrame] | None = None,
+) -> None:
     """Save missing timesheet report to Excel file.
 
     Args:
         df: DataFrame containing missing timesheet data.
         output_path: Path where Excel file should be saved.
+        extra_sheets: Additional sheets to write after the report, by name.
     """
-    df.to_excel(output_path, index=False, sheet_name="Missing Timesheets")
+    with pd.ExcelWriter(output_path) as writer:
+        df.to_excel(writer, index=False, sheet_name="Missing Timesheets")
+        for sheet_name, sheet_df in (extra_sheets or {}).items():
+            sheet_df.to_excel(writer, index=False, sheet_name=sheet_name)
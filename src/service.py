@@ -0,0 +1,350 @@
+"""Serve missing timesheet reports over HTTP from cached report state.
+
+Endpoints:
+    GET  /missing?date=YYYY-MM-DD&team=Europe&format=json|csv
+    GET  /metrics
+    POST /refresh
+
+Run with:
+    uv run python -m src.service --port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from src.config import (
+    DB_NAME,
+    DB_SERVER,
+    LEAVE_HISTORY_FILE,
+    REGIONAL_ALLOCATIONS_FILE,
+    SERVICE_HOST,
+    SERVICE_LOOKBACK_WEEKS,
+    SERVICE_PORT,
+    SERVICE_REFRESH_SECONDS,
+)
+from src.date_utils import get_last_two_weeks
+from src.pipeline import ReportTarget, acquire_inputs
+from src.regional_allocations import get_employee_regions
+from src.report_cache import ReportCache, ReportState
+
+logger = logging.getLogger(__name__)
+
+# Requests larger than this are rejected before parsing
+MAX_REQUEST_BYTES = 16 * 1024
+REQUEST_TIMEOUT_SECONDS = 10
+
+
+class RequestError(Exception):
+    """A request that can't be served, with the HTTP status to return."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def load_report_state() -> ReportState:
+    """Load report state covering the configured lookback window.
+
+    Submitted timesheets are loaded for every week in the window, so any
+    report date whose two-week period falls inside it can be served.
+
+    Returns:
+        Freshly loaded ReportState.
+    """
+    window_start, window_end = get_lookback_window(datetime.now(UTC))
+    target = ReportTarget(DB_NAME, DB_SERVER, DB_NAME, LEAVE_HISTORY_FILE, allocations_file=REGIONAL_ALLOCATIONS_FILE)
+    inputs = acquire_inputs(target, window_start, window_end)
+    # Without the allocations, team filtering matches nothing
+    regions = get_employee_regions(inputs.allocations) if inputs.allocations is not None else {}
+
+    return ReportState(
+        employees=inputs.employees,
+        exclusions=inputs.exclusions,
+        submitted=inputs.submitted,
+        leave=inputs.leave,
+        regions=regions,
+        window_start=window_start,
+        window_end=window_end,
+    )
+
+
+def get_lookback_window(now: datetime) -> tuple[datetime, datetime]:
+    """Calculate the span of weeks the service keeps submissions for.
+
+    Args:
+        now: Current date.
+
+    Returns:
+        Tuple of (start_date, end_date) covering SERVICE_LOOKBACK_WEEKS weeks.
+    """
+    _period_start, period_end = get_last_two_weeks(now)
+    return period_end - timedelta(days=7 * SERVICE_LOOKBACK_WEEKS - 1), period_end
+
+
+def parse_report_date(value: str | None) -> datetime:
+    """Parse the date query parameter.
+
+    Args:
+        value: Date in YYYY-MM-DD format, or None for today.
+
+    Returns:
+        Report date as a timezone-aware datetime.
+
+    Raises:
+        RequestError: If the date is malformed.
+    """
+    if value is None:
+        return datetime.now(UTC)
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC)
+    except ValueError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"date must be YYYY-MM-DD: {value}") from e
+
+
+def check_report_window(report_date: datetime, state: ReportState) -> None:
+    """Check a report date's reporting period is inside the cached window.
+
+    Args:
+        report_date: Date to calculate reporting period from.
+        state: The cached state the report will be computed from.
+
+    Raises:
+        RequestError: If the reporting period is outside the cached window.
+    """
+    period_start, period_end = get_last_two_weeks(report_date)
+    if period_start.date() < state.window_start.date() or period_end.date() > state.window_end.date():
+        window = f"{state.window_start:%Y-%m-%d} to {state.window_end:%Y-%m-%d}"
+        raise RequestError(
+            HTTPStatus.BAD_REQUEST, f"Reporting period for {report_date:%Y-%m-%d} is outside cached window {window}"
+        )
+
+
+def filter_team(report: pd.DataFrame, regions: dict[int, str], team: str | None) -> pd.DataFrame:
+    """Keep only report rows for employees in a team/region.
+
+    Args:
+        report: Missing timesheet report.
+        regions: Employee ID to region name.
+        team: Region to keep (case-insensitive), or None to keep all rows.
+
+    Returns:
+        The filtered report.
+    """
+    if team is None or report.empty:
+        return report
+    row_regions = report["Employee ID"].map(regions).fillna("").str.casefold()
+    return report[row_regions == team.casefold()].reset_index(drop=True)
+
+
+class ReportService:
+    """HTTP front end for a ReportCache."""
+
+    def __init__(self, cache: ReportCache):
+        self.cache = cache
+
+    async def handle(self, method: str, target: str) -> tuple[HTTPStatus, str, bytes]:
+        """Route a request to its endpoint.
+
+        Args:
+            method: HTTP method.
+            target: Request target (path and query string).
+
+        Returns:
+            Tuple of (status, content type, body).
+
+        Raises:
+            RequestError: If the request can't be served.
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        if url.path == "/missing" and method == "GET":
+            return await self._missing(query)
+        if url.path == "/metrics" and method == "GET":
+            return HTTPStatus.OK, "application/json", self._json(self.metrics())
+        if url.path == "/refresh" and method == "POST":
+            await self.cache.refresh()
+            return HTTPStatus.OK, "application/json", self._json(self.metrics())
+        if url.path in {"/missing", "/metrics", "/refresh"}:
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {url.path}")
+        raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}")
+
+    async def _missing(self, query: dict[str, str]) -> tuple[HTTPStatus, str, bytes]:
+        output_format = query.get("format", "json")
+        if output_format not in {"json", "csv"}:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "format must be json or csv")
+
+        report_date = parse_report_date(query.get("date"))
+        state = await self._state_for(report_date)
+        check_report_window(report_date, state)
+        report = filter_team(await self.cache.missing_timesheets(report_date), state.regions, query.get("team"))
+
+        if output_format == "csv":
+            return HTTPStatus.OK, "text/csv; charset=utf-8", report.to_csv(index=False).encode("utf-8")
+
+        period_start, period_end = get_last_two_weeks(report_date)
+        payload = {
+            "report_date": f"{report_date:%Y-%m-%d}",
+            "period_start": f"{period_start:%Y-%m-%d}",
+            "period_end": f"{period_end:%Y-%m-%d}",
+            "team": query.get("team"),
+            "cache_age_seconds": self.cache.age,
+            "count": len(report),
+            "rows": report.to_dict("records"),
+        }
+        return HTTPStatus.OK, "application/json", self._json(payload)
+
+    async def _state_for(self, report_date: datetime) -> ReportState:
+        """Get the cached state, reloading it when the reporting weeks have rolled past its window.
+
+        The window is fixed when the state loads, so once a new week ends the
+        default reporting period is outside it until the next refresh. Only
+        periods a fresh load would cover trigger a reload, so far-future dates
+        can't force repeated loads.
+
+        Args:
+            report_date: Date to calculate reporting period from.
+
+        Returns:
+            Report state to compute the report from.
+        """
+        state = await self.cache.get()
+        period_end = get_last_two_weeks(report_date)[1].date()
+        if state.window_end.date() < period_end <= get_lookback_window(datetime.now(UTC))[1].date():
+            logger.info("Reporting period ending %s is past the cached window, refreshing", period_end)
+            state = await self.cache.refresh()
+        return state
+
+    def metrics(self) -> dict[str, Any]:
+        """Collect cache and request metrics.
+
+        Returns:
+            Dictionary of metric name to value.
+        """
+        metrics = self.cache.metrics
+        return {
+            "cache_age_seconds": self.cache.age,
+            "requests": metrics.requests,
+            "errors": metrics.errors,
+            "refreshes": metrics.refreshes,
+            "refresh_failures": metrics.refresh_failures,
+            "last_refresh_seconds": metrics.last_refresh_seconds,
+            "latency": metrics.latency_summary(),
+        }
+
+    @staticmethod
+    def _json(payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, default=str).encode("utf-8")
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read one HTTP request from a connection, answer it and close.
+
+        Args:
+            reader: Stream to read the request from.
+            writer: Stream to write the response to.
+        """
+        started = time.perf_counter()
+        try:
+            method, target = await asyncio.wait_for(_read_request(reader), REQUEST_TIMEOUT_SECONDS)
+            status, content_type, body = await self.handle(method, target)
+        except RequestError as e:
+            status, content_type, body = e.status, "application/json", self._json({"error": str(e)})
+        except TimeoutError:
+            status, content_type, body = HTTPStatus.REQUEST_TIMEOUT, "application/json", b'{"error": "timeout"}'
+        except Exception as e:
+            logger.exception("Error serving request")
+            status, content_type, body = (
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                "application/json",
+                self._json({"error": str(e)}),
+            )
+
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("ascii") + body)
+            await writer.drain()
+        except ConnectionError:
+            logger.warning("Client disconnected before the response was sent")
+        finally:
+            writer.close()
+            self.cache.metrics.record_request(time.perf_counter() - started, status >= HTTPStatus.BAD_REQUEST)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str]:
+    """Read the request line and headers, discarding any body.
+
+    Args:
+        reader: Stream to read the request from.
+
+    Returns:
+        Tuple of (method, target).
+
+    Raises:
+        RequestError: If the request is malformed or too large.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError as e:
+        raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request headers too large") from e
+    except asyncio.IncompleteReadError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Incomplete request") from e
+
+    request_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+    parts = request_line.split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    return parts[0].upper(), parts[1]
+
+
+async def serve(host: str, port: int, cache: ReportCache) -> None:
+    """Load the initial state, then serve requests and refresh on schedule.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on.
+        cache: Cache holding the report state.
+    """
+    service = ReportService(cache)
+    await cache.refresh()
+    server = await asyncio.start_server(service.serve_connection, host, port, limit=MAX_REQUEST_BYTES)
+    refresher = asyncio.create_task(cache.run_scheduled_refresh())
+    logger.info("Serving missing timesheet reports on http://%s:%d", host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        refresher.cancel()
+
+
+def main() -> None:
+    """Entry point for the report service."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Serve missing timesheet reports over HTTP.")
+    parser.add_argument("--host", default=SERVICE_HOST, help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help="Port to listen on")
+    parser.add_argument("--refresh", type=float, default=SERVICE_REFRESH_SECONDS, help="Seconds between refreshes")
+    args = parser.parse_args()
+
+    cache = ReportCache(load_report_state, args.refresh)
+    asyncio.run(serve(args.host, args.port, cache))
+
+
+if __name__ == "__main__":
+    main()
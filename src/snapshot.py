@@ -0,0 +1,281 @@
+"""Memory-mapped snapshot of report state for fast ad-hoc lookups.
+
+The snapshot is a single binary file laid out as fixed-width int32 arrays
+followed by a UTF-8 string blob, so it can be opened with mmap and queried
+with binary search without pandas. Layout (native byte order):
+
+    header        magic, employee count, week count, region count, blob size
+    employee_ids  int32[employees], sorted ascending
+    region_index  int32[employees], index into regions or -1
+    name_offsets  int32[2 * employees + 1], first/last name spans in the blob
+    region_offs   int32[regions + 1], region name spans in the blob
+    week_ends     int32[weeks], proleptic ordinals of each week ending date
+    cells         uint8[employees * weeks], status flags per employee-week
+    blob          UTF-8 strings
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from enum import IntFlag
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+_MAGIC = b"MTSNAP01"
+_HEADER = struct.Struct("=8siiii")
+
+
+class WeekStatus(IntFlag):
+    """Status flags recorded for each employee-week."""
+
+    NONE = 0
+    SUBMITTED = 1
+    FULL_WEEK_LEAVE = 2
+    EXCLUDED = 4
+    NOT_STARTED = 8
+    MISSING = 16
+
+
+@dataclass(frozen=True)
+class SnapshotEmployee:
+    """Employee details stored in a snapshot."""
+
+    employee_id: int
+    first_name: str
+    last_name: str
+    region: str
+
+
+def write_snapshot(
+    path: str | Path,
+    employees: Sequence[SnapshotEmployee],
+    week_ends: Sequence[date],
+    statuses: Mapping[tuple[int, date], WeekStatus],
+) -> None:
+    """Serialize report state to a snapshot file.
+
+    The file is written next to the destination and then swapped in, so
+    readers never see a partially written snapshot.
+
+    Args:
+        path: Destination snapshot file.
+        employees: Employees to include; IDs must be unique.
+        week_ends: Week ending dates covered by the snapshot.
+        statuses: Flags per (employee ID, week ending); missing keys are NONE.
+
+    Raises:
+        ValueError: If employee IDs are not unique.
+    """
+    ordered = sorted(employees, key=lambda emp: emp.employee_id)
+    ids = [emp.employee_id for emp in ordered]
+    if len(set(ids)) != len(ids):
+        msg = "Snapshot employee IDs must be unique"
+        raise ValueError(msg)
+
+    weeks = sorted(week_ends)
+    regions = sorted({emp.region for emp in ordered if emp.region})
+    region_lookup = {region: i for i, region in enumerate(regions)}
+
+    blob = bytearray()
+    name_offsets = array("i", [0])
+    for emp in ordered:
+        for name in (emp.first_name, emp.last_name):
+            blob += name.encode("utf-8")
+            name_offsets.append(len(blob))
+    region_offsets = array("i", [len(blob)])
+    for region in regions:
+        blob += region.encode("utf-8")
+        region_offsets.append(len(blob))
+
+    cells = bytearray(len(ordered) * len(weeks))
+    for row, emp_id in enumerate(ids):
+        for col, week_end in enumerate(weeks):
+            cells[row * len(weeks) + col] = statuses.get((emp_id, week_end), WeekStatus.NONE)
+
+    # Pad the cell block so the blob that follows starts 4-byte aligned
+    cells += bytes(-len(cells) % 4)
+
+    destination = Path(path)
+    temp_path = destination.with_name(destination.name + ".tmp")
+    with temp_path.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(ordered), len(weeks), len(regions), len(blob)))
+        f.write(array("i", ids).tobytes())
+        f.write(array("i", [region_lookup.get(emp.region, -1) for emp in ordered]).tobytes())
+        f.write(name_offsets.tobytes())
+        f.write(region_offsets.tobytes())
+        f.write(array("i", [week.toordinal() for week in weeks]).tobytes())
+        f.write(cells)
+        f.write(blob)
+    os.replace(temp_path, destination)
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: str | Path):
+        with Path(path).open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        magic, n_employees, n_weeks, n_regions, blob_size = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            view.release()
+            self._mmap.close()
+            msg = f"Not a timesheet snapshot file: {path}"
+            raise ValueError(msg)
+
+        self._n_weeks = n_weeks
+        self._views: list[memoryview] = [view]
+        offset = _HEADER.size
+        self._employee_ids, offset = self._int_array(view, offset, n_employees)
+        self._region_index, offset = self._int_array(view, offset, n_employees)
+        self._name_offsets, offset = self._int_array(view, offset, 2 * n_employees + 1)
+        self._region_offsets, offset = self._int_array(view, offset, n_regions + 1)
+        week_ordinals, offset = self._int_array(view, offset, n_weeks)
+        cell_count = n_employees * n_weeks
+        self._cells = self._slice(view, offset, cell_count)
+        offset += cell_count + (-cell_count % 4)
+        self._blob = self._slice(view, offset, blob_size)
+
+        self.week_ends: tuple[date, ...] = tuple(date.fromordinal(ordinal) for ordinal in week_ordinals)
+        self.regions: tuple[str, ...] = tuple(self._region_name(i) for i in range(n_regions))
+
+    def _slice(self, view: memoryview, offset: int, length: int) -> memoryview:
+        """Take a sub-view of the mapped file and track it for release."""
+        sub = view[offset : offset + length]
+        self._views.append(sub)
+        return sub
+
+    def _int_array(self, view: memoryview, offset: int, count: int) -> tuple[memoryview, int]:
+        """Take an int32 array view and return it with the next offset."""
+        raw = self._slice(view, offset, count * 4)
+        ints = raw.cast("i")
+        self._views.append(ints)
+        return ints, offset + count * 4
+
+    def _text(self, start: int, end: int) -> str:
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+    def _region_name(self, index: int) -> str:
+        return self._text(self._region_offsets[index], self._region_offsets[index + 1]) if index >= 0 else ""
+
+    def _row(self, employee_id: int) -> int | None:
+        """Find an employee's row by binary search over the sorted IDs."""
+        row = bisect_left(self._employee_ids, employee_id)
+        if row < len(self._employee_ids) and self._employee_ids[row] == employee_id:
+            return row
+        return None
+
+    def _employee_at(self, row: int) -> SnapshotEmployee:
+        offsets = self._name_offsets
+        return SnapshotEmployee(
+            employee_id=self._employee_ids[row],
+            first_name=self._text(offsets[2 * row], offsets[2 * row + 1]),
+            last_name=self._text(offsets[2 * row + 1], offsets[2 * row + 2]),
+            region=self._region_name(self._region_index[row]),
+        )
+
+    def _week_column(self, week_end: date) -> int | None:
+        try:
+            return self.week_ends.index(week_end)
+        except ValueError:
+            return None
+
+    def employee(self, employee_id: int) -> SnapshotEmployee | None:
+        """Look up an employee's details.
+
+        Args:
+            employee_id: The employee ID to look up.
+
+        Returns:
+            The employee, or None if not in the snapshot.
+        """
+        row = self._row(employee_id)
+        return None if row is None else self._employee_at(row)
+
+    def status(self, employee_id: int, week_end: date) -> WeekStatus | None:
+        """Get the status flags for one employee-week.
+
+        Args:
+            employee_id: The employee ID to look up.
+            week_end: Week ending date (Thursday).
+
+        Returns:
+            The week's status flags, or None if the employee or week is unknown.
+        """
+        row = self._row(employee_id)
+        col = self._week_column(week_end)
+        if row is None or col is None:
+            return None
+        return WeekStatus(self._cells[row * self._n_weeks + col])
+
+    def missing_weeks(self, employee_id: int) -> list[date]:
+        """List the weeks an employee is missing a timesheet for.
+
+        Args:
+            employee_id: The employee ID to look up.
+
+        Returns:
+            Week ending dates flagged as missing, oldest first.
+        """
+        row = self._row(employee_id)
+        if row is None:
+            return []
+        base = row * self._n_weeks
+        return [week for col, week in enumerate(self.week_ends) if self._cells[base + col] & WeekStatus.MISSING]
+
+    def missing_employees(self, week_end: date, region: str | None = None) -> list[SnapshotEmployee]:
+        """List employees missing a timesheet for a week.
+
+        Args:
+            week_end: Week ending date (Thursday).
+            region: Only include employees in this region (case-insensitive).
+
+        Returns:
+            Missing employees ordered by employee ID.
+        """
+        col = self._week_column(week_end)
+        if col is None:
+            return []
+
+        region_filter: int | None = None
+        if region is not None:
+            matches = [i for i, name in enumerate(self.regions) if name.casefold() == region.casefold()]
+            if not matches:
+                return []
+            region_filter = matches[0]
+
+        missing: list[SnapshotEmployee] = []
+        for row in range(len(self._employee_ids)):
+            if not self._cells[row * self._n_weeks + col] & WeekStatus.MISSING:
+                continue
+            if region_filter is not None and self._region_index[row] != region_filter:
+                continue
+            missing.append(self._employee_at(row))
+        return missing
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Return the snapshot for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the memory map on leaving a with statement."""
+        self.close()
@@ -0,0 +1,78 @@
+"""Build a report snapshot from the data used to generate the report."""
+
+from collections.abc import Mapping
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+
+from src.date_utils import get_reporting_weeks
+from src.eligibility_rules import DEFAULT_RULES, RuleSet
+from src.pipeline import ReportInputs
+from src.report_generator import build_employee_week_matrix
+from src.snapshot import SnapshotEmployee, WeekStatus, write_snapshot
+
+_RULE_SET = RuleSet(DEFAULT_RULES)
+
+
+def build_week_statuses(inputs: ReportInputs, report_date: datetime) -> dict[tuple[int, date], WeekStatus]:
+    """Flag each employee-week from the same matrix and rules as the report.
+
+    Args:
+        inputs: Data the report was generated from.
+        report_date: Date the reporting period was calculated from.
+
+    Returns:
+        Dictionary mapping (employee ID, week ending) to status flags, for
+        employee-weeks with at least one flag.
+    """
+    matrix = build_employee_week_matrix(
+        inputs.employees, inputs.submitted, inputs.leave, inputs.exclusions, report_date
+    )
+    keep, _stats = _RULE_SET.evaluate(matrix)
+
+    flags = (
+        np.where(matrix["Excluded"], WeekStatus.EXCLUDED, 0)
+        | np.where(matrix["StartDate"] > matrix["WeekStart"], WeekStatus.NOT_STARTED, 0)
+        | np.where(matrix["Submitted"], WeekStatus.SUBMITTED, 0)
+        | np.where(matrix["FullWeekLeave"], WeekStatus.FULL_WEEK_LEAVE, 0)
+        | np.where(keep, WeekStatus.MISSING, 0)
+    )
+    return {
+        (int(emp_id), week_end.date()): WeekStatus(int(flag))
+        for emp_id, week_end, flag in zip(matrix["EmployeeID"], matrix["WeekEnd"], flags, strict=True)
+        if flag
+    }
+
+
+def save_snapshot(
+    path: str | Path,
+    inputs: ReportInputs,
+    regions: Mapping[int, str],
+    report_date: datetime,
+) -> None:
+    """Write the snapshot for a report run.
+
+    Args:
+        path: Destination snapshot file.
+        inputs: Data the report was generated from.
+        regions: Employee ID to region name; employees without one get "".
+        report_date: Date the reporting period was calculated from.
+    """
+    employees = [
+        SnapshotEmployee(
+            employee_id=int(emp_id),
+            first_name=str(first_name),
+            last_name=str(last_name),
+            region=regions.get(int(emp_id), ""),
+        )
+        for emp_id, first_name, last_name in zip(
+            inputs.employees["EmployeeID"].tolist(),
+            inputs.employees["FirstName"].tolist(),
+            inputs.employees["LastName"].tolist(),
+            strict=True,
+        )
+    ]
+    statuses = build_week_statuses(inputs, report_date)
+    week_ends = [end.date() for _start, end in get_reporting_weeks(report_date)]
+    write_snapshot(path, employees, week_ends, statuses)
@@ -0,0 +1,153 @@
+"""Answer ad-hoc missing timesheet questions from the report snapshot.
+
+Examples:
+    uv run python -m src.snapshot_query --employee 506
+    uv run python -m src.snapshot_query --employee 506 --week 04/12/25
+    uv run python -m src.snapshot_query --week 04/12/25 --region "Asia Pacific"
+"""
+
+import argparse
+import sys
+import time
+from datetime import UTC, date, datetime
+
+from src.config import SNAPSHOT_FILE
+from src.snapshot import Snapshot, SnapshotEmployee, WeekStatus
+
+WEEK_FORMAT = "%d/%m/%y"
+
+
+def parse_week(value: str) -> date:
+    """Parse a week ending date in DD/MM/YY format.
+
+    Args:
+        value: Date string such as 04/12/25.
+
+    Returns:
+        The parsed date.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value isn't a DD/MM/YY date.
+    """
+    try:
+        return datetime.strptime(value, WEEK_FORMAT).replace(tzinfo=UTC).date()
+    except ValueError as e:
+        msg = f"Week must be in DD/MM/YY format: {value}"
+        raise argparse.ArgumentTypeError(msg) from e
+
+
+def describe_status(status: WeekStatus) -> str:
+    """Render status flags as a readable list.
+
+    Args:
+        status: Flags for one employee-week.
+
+    Returns:
+        Comma-separated flag names, or "no record".
+    """
+    names = [str(flag.name).lower().replace("_", " ") for flag in WeekStatus if flag in status]
+    return ", ".join(names) if names else "no record"
+
+
+def _format_employee(employee: SnapshotEmployee) -> str:
+    region = f" ({employee.region})" if employee.region else ""
+    return f"{employee.employee_id} - {employee.first_name} {employee.last_name}{region}"
+
+
+def _week_not_found(snapshot: Snapshot, week: date) -> str:
+    weeks = ", ".join(week_end.strftime(WEEK_FORMAT) for week_end in snapshot.week_ends)
+    return f"Week ending {week.strftime(WEEK_FORMAT)} is not in the snapshot (weeks: {weeks})"
+
+
+def query_employee(snapshot: Snapshot, employee_id: int, week: date | None) -> list[str]:
+    """Report an employee's status for one week, or their missing weeks.
+
+    Args:
+        snapshot: Open snapshot to query.
+        employee_id: The employee ID to look up.
+        week: Week ending date, or None for all weeks in the snapshot.
+
+    Returns:
+        Output lines for the query.
+    """
+    employee = snapshot.employee(employee_id)
+    if employee is None:
+        return [f"Employee {employee_id} is not in the snapshot"]
+
+    if week is not None:
+        status = snapshot.status(employee_id, week)
+        if status is None:
+            return [_week_not_found(snapshot, week)]
+        verdict = "MISSING" if WeekStatus.MISSING in status else "not missing"
+        return [f"{_format_employee(employee)}: {verdict} [{describe_status(status)}]"]
+
+    missing = snapshot.missing_weeks(employee_id)
+    if not missing:
+        return [f"{_format_employee(employee)}: no missing timesheets"]
+    return [f"{_format_employee(employee)}: missing {', '.join(w.strftime(WEEK_FORMAT) for w in missing)}"]
+
+
+def query_week(snapshot: Snapshot, week: date, region: str | None) -> list[str]:
+    """List employees missing a timesheet for a week.
+
+    Args:
+        snapshot: Open snapshot to query.
+        week: Week ending date.
+        region: Only include employees in this region, or None for everyone.
+
+    Returns:
+        Output lines for the query.
+    """
+    if week not in snapshot.week_ends:
+        return [_week_not_found(snapshot, week)]
+
+    employees = snapshot.missing_employees(week, region)
+    scope = f" in {region}" if region else ""
+    lines = [f"{len(employees)} missing for week ending {week.strftime(WEEK_FORMAT)}{scope}"]
+    lines.extend(f"  {_format_employee(employee)}" for employee in employees)
+    return lines
+
+
+def run_query(snapshot: Snapshot, args: argparse.Namespace) -> list[str]:
+    """Answer the query described by the command line arguments.
+
+    Args:
+        snapshot: Open snapshot to query.
+        args: Parsed arguments with employee, week and region.
+
+    Returns:
+        Output lines for the query.
+    """
+    if args.employee is not None:
+        return query_employee(snapshot, args.employee, args.week)
+    if args.week is not None:
+        return query_week(snapshot, args.week, args.region)
+
+    weeks = ", ".join(week_end.strftime(WEEK_FORMAT) for week_end in snapshot.week_ends)
+    return [f"Weeks in snapshot: {weeks}", f"Regions: {', '.join(snapshot.regions) or 'none'}"]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for snapshot queries."""
+    parser = argparse.ArgumentParser(description="Query the missing timesheet snapshot.")
+    parser.add_argument("--employee", type=int, help="Employee ID to look up")
+    parser.add_argument("--week", type=parse_week, help="Week ending date (DD/MM/YY)")
+    parser.add_argument("--region", help="Restrict a week query to one region")
+    parser.add_argument("--snapshot", default=SNAPSHOT_FILE, help="Snapshot file to query")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        with Snapshot(args.snapshot) as snapshot:
+            lines = run_query(snapshot, args)
+    except FileNotFoundError:
+        print(f"Snapshot not found: {args.snapshot} (run the report first)", file=sys.stderr)
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print("\n".join(lines))
+    print(f"({elapsed_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
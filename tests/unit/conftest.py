@@ -0,0 +1,34 @@
+"""Shared fixtures for the unit tests."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+
+from src.report_cache import ReportState
+
+
+def _report_state() -> ReportState:
+    return ReportState(
+        employees=pd.DataFrame(
+            {
+                "EmployeeID": [138, 506],
+                "FirstName": ["Blaire", "Nick"],
+                "LastName": ["Alder", "Bell"],
+                "StartDate": pd.to_datetime(["2020-01-01", "2020-01-01"]),
+            }
+        ),
+        exclusions=frozenset(),
+        submitted=pd.DataFrame({"EmployeeID": [138], "DatePeriod": pd.to_datetime(["2025-11-24"])}),
+        leave=pd.DataFrame(),
+        regions={138: "Europe", 506: "Asia Pacific"},
+        window_start=datetime(2025, 10, 17, tzinfo=UTC),
+        window_end=datetime(2025, 12, 4, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def make_state() -> Callable[[], ReportState]:
+    """Loader building a fresh ReportState for two employees on each call."""
+    return _report_state
@@ -0,0 +1,162 @@
+"""Unit tests for the eligibility_rules module."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pytest
+
+from src.eligibility_rules import DEFAULT_RULES, Rule, RuleSet
+from src.report_generator import build_employee_week_matrix, evaluate_missing_timesheets
+
+REPORT_DATE = datetime(2025, 12, 8, tzinfo=UTC)
+
+
+def _matrix(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "Excluded": rng.random(rows) < 0.1,
+            "Submitted": rng.random(rows) < 0.5,
+            "Score": rng.random(rows),
+        }
+    )
+
+
+class CountingPredicate:
+    """Predicate that records how often and with how many rows it is called."""
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.calls: list[int] = []
+
+    def __call__(self, score: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        self.calls.append(len(score))
+        return score > self.threshold
+
+
+class RecordingPredicate:
+    """Wraps a predicate, recording the length of every array it is called with."""
+
+    def __init__(self, predicate: Callable[..., Any]) -> None:
+        self.predicate = predicate
+        self.calls: list[list[int]] = []
+
+    def __call__(self, *columns: npt.NDArray[Any]) -> Any:
+        self.calls.append([len(column) for column in columns])
+        return self.predicate(*columns)
+
+
+def _employees(count: int) -> pd.DataFrame:
+    ids = np.arange(1, count + 1)
+    return pd.DataFrame(
+        {
+            "EmployeeID": ids,
+            "FirstName": "First",
+            "LastName": "Last",
+            "StartDate": pd.Timestamp("2020-01-01"),
+            "PartialTimesheet": ids % 10 == 0,
+        }
+    )
+
+
+class TestRuleSet:
+    """Test cases for the RuleSet class."""
+
+    def test_removed_counts_follow_declared_order(self) -> None:
+        matrix = pd.DataFrame({"Excluded": [True, True, False, False], "Submitted": [True, False, True, False]})
+        rules = RuleSet(
+            [
+                Rule("excluded", ("Excluded",), lambda excluded: excluded),
+                Rule("submitted", ("Submitted",), lambda submitted: submitted),
+            ]
+        )
+
+        keep, stats = rules.evaluate(matrix)
+
+        assert keep.tolist() == [False, False, False, True]
+        assert [(s.name, s.removed) for s in stats] == [("excluded", 2), ("submitted", 1)]
+        assert all(s.seconds >= 0 for s in stats)
+
+    def test_each_rule_runs_once_over_whole_matrix(self) -> None:
+        matrix = _matrix(100_000)
+        predicates = [CountingPredicate(threshold) for threshold in np.linspace(0.5, 0.99, 20)]
+        rules = RuleSet([Rule(f"score_{i}", ("Score",), p) for i, p in enumerate(predicates)])
+
+        rules.evaluate(matrix)
+
+        assert all(p.calls == [100_000] for p in predicates)
+
+    def test_duplicate_rule_names_raise_error(self) -> None:
+        rule = Rule("same", ("Excluded",), lambda excluded: excluded)
+        with pytest.raises(ValueError, match="unique"):
+            RuleSet([rule, rule])
+
+    def test_missing_input_raises_error(self) -> None:
+        rules = RuleSet([Rule("leave", ("FullWeekLeave",), lambda leave: leave)])
+        with pytest.raises(ValueError, match="FullWeekLeave"):
+            rules.evaluate(_matrix(3))
+
+    def test_wrong_length_mask_raises_error(self) -> None:
+        rules = RuleSet([Rule("bad", ("Excluded",), lambda _excluded: np.array([True]))])
+        with pytest.raises(ValueError, match="returned 1 rows for 3"):
+            rules.evaluate(_matrix(3))
+
+
+class TestDefaultRules:
+    """Test cases for the default eligibility rules."""
+
+    def test_full_week_leave_exempts_partial_timesheets(self) -> None:
+        matrix = pd.DataFrame(
+            {
+                "Excluded": [False, False, False],
+                "StartDate": pd.to_datetime(["2020-01-01", None, "2020-01-01"]),
+                "WeekStart": pd.Timestamp("2025-11-21"),
+                "Submitted": [False, False, False],
+                "FullWeekLeave": [True, True, False],
+                "PartialTimesheet": [False, True, False],
+            }
+        )
+
+        keep, stats = RuleSet(DEFAULT_RULES).evaluate(matrix)
+
+        assert keep.tolist() == [False, True, True]
+        assert {s.name: s.removed for s in stats}["full_week_leave"] == 1
+
+    def test_not_started_applies_per_week(self) -> None:
+        matrix = pd.DataFrame(
+            {
+                "Excluded": False,
+                "StartDate": pd.Timestamp("2025-11-28"),
+                "WeekStart": pd.to_datetime(["2025-11-21", "2025-11-28"]),
+                "Submitted": False,
+                "FullWeekLeave": False,
+                "PartialTimesheet": False,
+            }
+        )
+
+        keep, _stats = RuleSet(DEFAULT_RULES).evaluate(matrix)
+
+        assert keep.tolist() == [False, True]
+
+
+class TestDefaultRulesOnReportMatrix:
+    """The default rules stay one vectorized pass as the employee-week matrix grows."""
+
+    @pytest.mark.parametrize("employee_count", [500, 1000])
+    def test_each_rule_called_once_with_whole_matrix(self, employee_count: int) -> None:
+        employees = _employees(employee_count)
+        submitted = pd.DataFrame({"EmployeeID": employees["EmployeeID"][::2], "DatePeriod": pd.Timestamp("2025-11-24")})
+        matrix = build_employee_week_matrix(employees, submitted, pd.DataFrame(), frozenset({1, 2}), REPORT_DATE)
+        predicates = [RecordingPredicate(rule.predicate) for rule in DEFAULT_RULES]
+        rules = RuleSet([Rule(rule.name, rule.inputs, p) for rule, p in zip(DEFAULT_RULES, predicates, strict=True)])
+
+        _report, stats = evaluate_missing_timesheets(matrix, rules)
+
+        assert len(matrix) == employee_count * 2
+        for rule, predicate in zip(DEFAULT_RULES, predicates, strict=True):
+            assert predicate.calls == [[len(matrix)] * len(rule.inputs)]
+        assert len(stats) == len(DEFAULT_RULES)
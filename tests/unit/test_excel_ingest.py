@@ -0,0 +1,108 @@
+"""Unit tests for the excel_ingest module."""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.excel_ingest import SheetSpec, read_sheet, read_sheets
+
+
+@pytest.fixture
+def workbook_path(tmp_path: Path) -> str:
+    workbook = Workbook()
+    leave = workbook.active
+    assert leave is not None
+    leave.title = "Leave"
+    leave.append(["Id", "Name", "Cost Centre", "Authoriser", "Date"])
+    leave.append([506, "BELL, Nick", "70-310", "Jono", date(2025, 11, 28)])
+    leave.append([None, None, None, None, None])
+    leave.append([715, "HIGGINS, Robert", "70-320", "Vernon", date(2025, 12, 1)])
+
+    allocations = workbook.create_sheet("Regional allocations LIVE")
+    allocations.append(["Regional people allocations"])
+    allocations.append([])
+    allocations.append(["Employee ID", "Surname", "Current Region", "Timesheet?", "Partial? "])
+    allocations.append([506, "BELL", "Asia Pacific", "Y", "N"])
+    allocations.append([None, "CAVE", "DeltaVee", "Y", "y"])
+
+    path = tmp_path / "workbook.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+class TestReadSheet:
+    """Test cases for the read_sheet function."""
+
+    def test_projects_requested_columns(self, workbook_path: str) -> None:
+        df = read_sheet(SheetSpec(workbook_path, columns=("Date", "Id")))
+
+        assert list(df.columns) == ["Date", "Id"]
+        assert df["Id"].tolist() == [506, 715]
+
+    def test_reads_all_columns_by_default(self, workbook_path: str) -> None:
+        df = read_sheet(SheetSpec(workbook_path))
+
+        assert list(df.columns) == ["Id", "Name", "Cost Centre", "Authoriser", "Date"]
+        assert len(df) == 2
+
+    def test_header_row_and_named_sheet(self, workbook_path: str) -> None:
+        spec = SheetSpec(
+            workbook_path,
+            sheet_name="Regional allocations LIVE",
+            header_row=2,
+            columns=("Employee ID", "Partial?"),
+            dtypes=(("Employee ID", "Int64"),),
+        )
+
+        df = read_sheet(spec)
+
+        assert list(df.columns) == ["Employee ID", "Partial?"]
+        assert df["Employee ID"].dtype == "Int64"
+        assert df["Employee ID"].isna().tolist() == [False, True]
+
+    def test_dtypes_applied(self, workbook_path: str) -> None:
+        spec = SheetSpec(workbook_path, columns=("Id", "Date"), dtypes=(("Id", "int64"), ("Date", "datetime64[ns]")))
+
+        df = read_sheet(spec)
+
+        assert df["Id"].dtype == "int64"
+        assert df["Date"].dtype == "datetime64[ns]"
+        assert df["Date"].tolist() == [pd.Timestamp(2025, 11, 28), pd.Timestamp(2025, 12, 1)]
+
+    def test_missing_column_raises_error(self, workbook_path: str) -> None:
+        with pytest.raises(ValueError, match="Column 'Region' not found"):
+            read_sheet(SheetSpec(workbook_path, columns=("Region",)))
+
+    def test_missing_sheet_raises_error(self, workbook_path: str) -> None:
+        with pytest.raises(ValueError, match="Sheet 'Archive' not found"):
+            read_sheet(SheetSpec(workbook_path, sheet_name="Archive"))
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="Excel file not found"):
+            read_sheet(SheetSpec(str(tmp_path / "missing.xlsx")))
+
+
+class TestReadSheets:
+    """Test cases for the read_sheets function."""
+
+    def test_parallel_read_preserves_order(self, workbook_path: str) -> None:
+        specs = [
+            SheetSpec(workbook_path, sheet_name="Regional allocations LIVE", header_row=2, columns=("Surname",)),
+            SheetSpec(workbook_path, columns=("Id",)),
+        ]
+
+        frames = read_sheets(specs, max_workers=2)
+
+        assert frames[0]["Surname"].tolist() == ["BELL", "CAVE"]
+        assert frames[1]["Id"].tolist() == [506, 715]
+
+    def test_specs_are_hashable(self, workbook_path: str) -> None:
+        spec = SheetSpec(workbook_path, columns=("Id",), dtypes=(("Id", "Int64"),))
+
+        assert len({spec, SheetSpec(workbook_path, columns=("Id",), dtypes=(("Id", "Int64"),))}) == 1
+
+    def test_empty_specs(self) -> None:
+        assert read_sheets([]) == []
@@ -0,0 +1,176 @@
+"""Unit tests for the leave_parser module."""
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.leave_parser import get_full_week_leave, load_leave_history
+
+WEEK_START = datetime(2025, 11, 21, tzinfo=UTC)  # Friday
+NEW_YEAR_WEEK = datetime(2026, 1, 2, tzinfo=UTC)  # Friday 2 January is a public holiday
+NEW_YEAR_DAYS = ("2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08")
+OFFICES = dict.fromkeys([98, 138, 267, 484, 714], "New Zealand")
+
+# Header row of the leave history export
+EXPORT_COLUMNS = [
+    "Id",
+    "Name",
+    "Cost Centre",
+    "Leave Authoriser",
+    "Date",
+    "Leave Type",
+    "Status",
+    "Element",
+    "Given",
+    "Taken",
+    "Reason",
+    "Approved by",
+    "Approved on",
+]
+
+
+def _leave(employee_id: int, *days: str) -> pd.DataFrame:
+    return pd.DataFrame({"Id": [employee_id] * len(days), "Date": pd.to_datetime(list(days))})
+
+
+def _export_rows(
+    employee_id: int, days: tuple[str, ...], status: str = "Approved", taken: str = "7.50"
+) -> list[list[object]]:
+    return [
+        [
+            employee_id,
+            "ALDER, Blaire (Blaire Alder)",
+            "70-320|DataTorque Business|Europe",
+            "Vernon Kay",
+            date.fromisoformat(day),
+            "Annual Leave",
+            status,
+            "AL",
+            None,
+            taken,
+            None,
+            "46243vk",
+            date(2025, 12, 3),
+        ]
+        for day in days
+    ]
+
+
+def _export(*rows: list[object]) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=EXPORT_COLUMNS)
+    df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+
+class TestGetFullWeekLeave:
+    """Test cases for the get_full_week_leave function."""
+
+    def test_all_weekdays_covered(self) -> None:
+        leave = _leave(506, "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-27")
+
+        result = get_full_week_leave(leave, [WEEK_START])
+
+        assert result["EmployeeID"].tolist() == [506]
+        assert result["WeekStart"].tolist() == [pd.Timestamp(2025, 11, 21)]
+
+    def test_partial_week_not_covered(self) -> None:
+        leave = _leave(506, "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26")
+
+        assert get_full_week_leave(leave, [WEEK_START]).empty
+
+    def test_duplicate_and_weekend_days_not_counted(self) -> None:
+        leave = _leave(506, "2025-11-21", "2025-11-21", "2025-11-22", "2025-11-23", "2025-11-24", "2025-11-25")
+
+        assert get_full_week_leave(leave, [WEEK_START]).empty
+
+    def test_weeks_outside_request_ignored(self) -> None:
+        leave = _leave(506, "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04")
+
+        assert get_full_week_leave(leave, [WEEK_START]).empty
+
+    def test_missing_columns_returns_empty(self) -> None:
+        assert get_full_week_leave(pd.DataFrame({"Other": [1]}), [WEEK_START]).empty
+
+
+class TestGetFullWeekLeaveFromExport:
+    """Test cases for get_full_week_leave on rows laid out like the leave export."""
+
+    def test_public_holiday_needs_no_leave(self) -> None:
+        leave = _export(*_export_rows(138, NEW_YEAR_DAYS))
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES)["EmployeeID"].tolist() == [138]
+
+    def test_holidays_follow_employee_office(self, caplog: pytest.LogCaptureFixture) -> None:
+        leave = _export(*_export_rows(138, NEW_YEAR_DAYS), *_export_rows(267, NEW_YEAR_DAYS))
+
+        result = get_full_week_leave(leave, [NEW_YEAR_WEEK], {138: "New Zealand", 267: "Cyprus"})
+
+        assert result["EmployeeID"].tolist() == [138]
+        assert "No public holiday calendar for office 'Cyprus'" in caplog.text
+
+    def test_year_outside_calendar_warns(self, caplog: pytest.LogCaptureFixture) -> None:
+        leave = _export(*_export_rows(138, NEW_YEAR_DAYS))
+        calendars = {"New Zealand": {2025: frozenset({date(2025, 12, 25)})}}
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES, calendars).empty
+        assert "Public holiday calendar for New Zealand doesn't cover [2026]" in caplog.text
+
+    def test_pending_leave_not_counted(self) -> None:
+        leave = _export(*_export_rows(714, NEW_YEAR_DAYS, status="Pending"))
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES).empty
+
+    def test_processed_leave_counted(self) -> None:
+        leave = _export(*_export_rows(138, NEW_YEAR_DAYS, status="Processed", taken="1.00d"))
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES)["EmployeeID"].tolist() == [138]
+
+    def test_part_day_not_counted(self) -> None:
+        leave = _export(
+            *_export_rows(98, NEW_YEAR_DAYS[:3]),
+            *_export_rows(98, NEW_YEAR_DAYS[3:], taken="3.75"),
+        )
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES).empty
+
+    def test_part_day_in_days_not_counted(self) -> None:
+        leave = _export(
+            *_export_rows(138, NEW_YEAR_DAYS[:3], taken="1.00d"),
+            *_export_rows(138, NEW_YEAR_DAYS[3:], taken="0.75d"),
+        )
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES).empty
+
+    def test_part_time_full_days_counted(self) -> None:
+        leave = _export(*_export_rows(484, NEW_YEAR_DAYS, taken="5.00"))
+
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES)["EmployeeID"].tolist() == [484]
+
+    def test_balance_rows_not_counted(self) -> None:
+        rows = _export_rows(138, NEW_YEAR_DAYS[:3])
+        balance = _export_rows(138, NEW_YEAR_DAYS[3:], status="Processed", taken="")
+        balance[0][EXPORT_COLUMNS.index("Given")] = "150.00"
+
+        assert get_full_week_leave(_export(*rows, *balance), [NEW_YEAR_WEEK], OFFICES).empty
+
+
+class TestLoadLeaveHistory:
+    """Test cases for the load_leave_history function."""
+
+    def test_loads_export_layout(self, tmp_path: Path) -> None:
+        workbook = Workbook()
+        sheet = workbook.active
+        assert sheet is not None
+        sheet.append(EXPORT_COLUMNS)
+        for row in [*_export_rows(138, NEW_YEAR_DAYS), *_export_rows(267, NEW_YEAR_DAYS, status="Pending")]:
+            sheet.append(row)
+        path = tmp_path / "leave-history.xlsx"
+        workbook.save(path)
+
+        leave = load_leave_history(str(path))
+
+        assert list(leave.columns) == ["Id", "Date", "Status", "Taken"]
+        assert get_full_week_leave(leave, [NEW_YEAR_WEEK], OFFICES)["EmployeeID"].tolist() == [138]
@@ -0,0 +1,143 @@
+"""Unit tests for the multi_target module."""
+
+import threading
+import time
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+
+from src.multi_target import TargetLimits, merge_target_reports, run_targets
+from src.pipeline import ReportTarget
+
+REPORT_DATE = datetime(2025, 12, 8, tzinfo=UTC)
+
+
+def _report(*employee_ids: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Employee ID": list(employee_ids),
+            "First Name": ["First"] * len(employee_ids),
+            "Last Name": ["Last"] * len(employee_ids),
+            "Week Ending": ["04/12/25"] * len(employee_ids),
+        }
+    )
+
+
+def _target(name: str) -> ReportTarget:
+    return ReportTarget(name, f"{name}-server", "TimeTorque", f"{name}.xlsx")
+
+
+class TestRunTargets:
+    """Test cases for the run_targets function."""
+
+    def test_results_follow_target_order(self) -> None:
+        """Test that results are returned in configuration order."""
+        targets = [_target("a"), _target("b"), _target("c")]
+
+        def runner(target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            return _report(ord(target.name))
+
+        results = run_targets(targets, REPORT_DATE, limits=TargetLimits(max_workers=2), runner=runner)
+
+        assert [result.target.name for result in results] == ["a", "b", "c"]
+        assert all(result.error is None for result in results)
+
+    def test_failing_target_does_not_affect_others(self) -> None:
+        """Test that an unreachable server is recorded as an error."""
+
+        def runner(target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            if target.name == "down":
+                msg = "server unreachable"
+                raise ConnectionError(msg)
+            return _report(1)
+
+        results = run_targets([_target("down"), _target("up")], REPORT_DATE, runner=runner)
+
+        assert results[0].report is None
+        assert results[0].error == "server unreachable"
+        assert results[1].report is not None
+
+    def test_slow_target_times_out_without_blocking_others(self) -> None:
+        """Test that a hung target is abandoned after its timeout."""
+        release = threading.Event()
+
+        def runner(target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            if target.name == "slow":
+                release.wait(10)
+            return _report(1)
+
+        try:
+            limits = TargetLimits(timeout=1)
+            results = run_targets([_target("slow"), _target("fast")], REPORT_DATE, limits=limits, runner=runner)
+        finally:
+            release.set()
+
+        assert results[0].error == "Timed out after 1s"
+        assert results[1].report is not None
+
+    def test_hung_target_frees_its_slot_for_queued_targets(self) -> None:
+        """Test that targets queued behind a hung one still run promptly."""
+        release = threading.Event()
+
+        def runner(target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            if target.name == "hung":
+                release.wait(10)
+            return _report(1)
+
+        started = time.monotonic()
+        try:
+            limits = TargetLimits(max_workers=1, timeout=1)
+            results = run_targets([_target("hung"), _target("next")], REPORT_DATE, limits=limits, runner=runner)
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        assert results[0].error == "Timed out after 1s"
+        assert results[1].report is not None
+        assert elapsed < 5
+
+    def test_run_deadline_fails_unfinished_targets(self) -> None:
+        """Test that queued and running targets fail once the run deadline passes."""
+        release = threading.Event()
+
+        def runner(_target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            release.wait(10)
+            return _report(1)
+
+        try:
+            limits = TargetLimits(max_workers=1, timeout=30, deadline=1)
+            results = run_targets([_target("a"), _target("b")], REPORT_DATE, limits=limits, runner=runner)
+        finally:
+            release.set()
+
+        assert results[0].error == "Run deadline of 1s exceeded"
+        assert results[1].error == "Not started before the 1s run deadline"
+
+    def test_duplicate_target_names_raise_error(self) -> None:
+        """Test that duplicate target names are rejected."""
+        with pytest.raises(ValueError, match="unique"):
+            run_targets([_target("a"), _target("a")], REPORT_DATE, runner=lambda *_: _report())
+
+
+class TestMergeTargetReports:
+    """Test cases for the merge_target_reports function."""
+
+    def test_merge_adds_target_column(self) -> None:
+        """Test that merged rows are tagged with their target."""
+
+        def runner(target: ReportTarget, _report_date: datetime, _timeout: int) -> pd.DataFrame:
+            return _report(1, 2) if target.name == "a" else _report(3)
+
+        merged = merge_target_reports(run_targets([_target("a"), _target("b")], REPORT_DATE, runner=runner))
+
+        assert list(merged.columns) == ["Target", "Employee ID", "First Name", "Last Name", "Week Ending"]
+        assert merged["Target"].tolist() == ["a", "a", "b"]
+        assert merged["Employee ID"].tolist() == [1, 2, 3]
+
+    def test_merge_with_no_results_returns_empty_frame(self) -> None:
+        """Test that merging only failed targets yields an empty report."""
+        merged = merge_target_reports([])
+
+        assert merged.empty
+        assert merged.columns[0] == "Target"
@@ -0,0 +1,109 @@
+"""Unit tests for the pipeline module."""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.pipeline import load_workbooks, mark_offices, mark_partial_timesheets
+
+
+def _save(workbook: Workbook, path: Path) -> str:
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def leave_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    sheet = workbook.active
+    assert sheet is not None
+    sheet.append(["Id", "Name", "Cost Centre", "Leave Authoriser", "Date", "Leave Type", "Status", "Taken"])
+    sheet.append([506, "BELL, Nick", "70-310", "Jono Eagle", date(2025, 11, 28), "Annual Leave", "Approved", "7.50"])
+    return _save(workbook, tmp_path / "leave.xlsx")
+
+
+@pytest.fixture
+def allocations_file(tmp_path: Path) -> str:
+    workbook = Workbook()
+    sheet = workbook.active
+    assert sheet is not None
+    sheet.title = "Regional allocations LIVE"
+    sheet.append(["Regional people allocations"])
+    sheet.append([])
+    sheet.append(["Employee ID", "Surname", "Current Region", "Office", "Timesheet?", "Partial? "])
+    sheet.append([506, "BELL", "Asia Pacific", "New Zealand", "Y", "Y"])
+    return _save(workbook, tmp_path / "allocations.xlsx")
+
+
+class TestLoadWorkbooks:
+    """Test cases for the load_workbooks function."""
+
+    def test_loads_both_workbooks(self, leave_file: str, allocations_file: str) -> None:
+        leave, allocations = load_workbooks(leave_file, allocations_file)
+
+        assert leave["Id"].tolist() == [506]
+        assert allocations is not None
+        assert allocations.to_dict("records") == [
+            {"EmployeeID": 506, "Region": "Asia Pacific", "Office": "New Zealand", "Timesheet": True, "Partial": True}
+        ]
+
+    def test_without_allocations_file(self, leave_file: str) -> None:
+        leave, allocations = load_workbooks(leave_file, None)
+
+        assert len(leave) == 1
+        assert allocations is None
+
+    def test_unreadable_allocations_are_skipped(self, leave_file: str, tmp_path: Path) -> None:
+        leave, allocations = load_workbooks(leave_file, str(tmp_path / "missing.xlsx"))
+
+        assert len(leave) == 1
+        assert allocations is None
+
+    def test_missing_leave_file_raises_error(self, allocations_file: str, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="Excel file not found"):
+            load_workbooks(str(tmp_path / "missing.xlsx"), allocations_file)
+
+
+class TestMarkPartialTimesheets:
+    """Test cases for the mark_partial_timesheets function."""
+
+    EMPLOYEES = pd.DataFrame({"EmployeeID": [138, 506, 715]})
+
+    def test_marks_timesheet_and_partial_employees(self) -> None:
+        allocations = pd.DataFrame(
+            {
+                "EmployeeID": [138, 506, 715],
+                "Region": ["Europe", "Asia Pacific", "Europe"],
+                "Timesheet": [True, True, False],
+                "Partial": [True, False, True],
+            }
+        )
+
+        marked = mark_partial_timesheets(self.EMPLOYEES, allocations)
+
+        assert marked["PartialTimesheet"].tolist() == [True, False, False]
+
+    def test_without_allocations_nobody_is_marked(self) -> None:
+        marked = mark_partial_timesheets(self.EMPLOYEES, None)
+
+        assert marked["PartialTimesheet"].tolist() == [False, False, False]
+        assert "PartialTimesheet" not in self.EMPLOYEES.columns
+
+
+class TestMarkOffices:
+    """Test cases for the mark_offices function."""
+
+    EMPLOYEES = pd.DataFrame({"EmployeeID": [138, 506, 715]})
+
+    def test_maps_offices_from_allocations(self) -> None:
+        allocations = pd.DataFrame({"EmployeeID": [138, 506], "Office": ["Cyprus", "New Zealand"]})
+
+        marked = mark_offices(self.EMPLOYEES, allocations)
+
+        assert marked["Office"].tolist() == ["Cyprus", "New Zealand", ""]
+
+    def test_without_allocations_offices_are_empty(self) -> None:
+        assert mark_offices(self.EMPLOYEES, None)["Office"].tolist() == ["", "", ""]
@@ -0,0 +1,123 @@
+"""Unit tests for the report_cache module."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+
+from src.report_cache import ReportCache, ReportState, ServiceMetrics
+
+REPORT_DATE = datetime(2025, 12, 8, tzinfo=UTC)
+
+
+class CountingLoader:
+    """Loader that counts calls and can be held open to simulate a slow query."""
+
+    def __init__(self, make_state: Callable[[], ReportState]) -> None:
+        self.make_state = make_state
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self) -> ReportState:
+        self.calls += 1
+        self.release.wait(5)
+        return self.make_state()
+
+
+class TestReportCache:
+    """Test cases for the ReportCache class."""
+
+    def test_concurrent_requests_share_one_refresh(self, make_state: Callable[[], ReportState]) -> None:
+        loader = CountingLoader(make_state)
+        loader.release.clear()
+        cache = ReportCache(loader, refresh_interval=60)
+
+        async def scenario() -> list[ReportState]:
+            requests = [asyncio.create_task(cache.get()) for _ in range(10)]
+            requests.append(asyncio.create_task(cache.refresh()))
+            await asyncio.sleep(0.05)
+            loader.release.set()
+            return await asyncio.gather(*requests)
+
+        states = asyncio.run(scenario())
+
+        assert loader.calls == 1
+        assert all(state is states[0] for state in states)
+        assert cache.metrics.refreshes == 1
+
+    def test_refresh_after_completion_reloads(self, make_state: Callable[[], ReportState]) -> None:
+        loader = CountingLoader(make_state)
+        cache = ReportCache(loader, refresh_interval=60)
+
+        async def scenario() -> None:
+            await cache.get()
+            await cache.refresh()
+            await cache.get()
+
+        asyncio.run(scenario())
+
+        assert loader.calls == 2
+
+    def test_failed_refresh_is_counted_and_retried(self, make_state: Callable[[], ReportState]) -> None:
+        attempts: list[int] = []
+
+        def loader() -> ReportState:
+            attempts.append(1)
+            if len(attempts) == 1:
+                msg = "VPN down"
+                raise ConnectionError(msg)
+            return make_state()
+
+        cache = ReportCache(loader, refresh_interval=60)
+
+        async def scenario() -> ReportState:
+            with pytest.raises(ConnectionError):
+                await cache.get()
+            return await cache.get()
+
+        asyncio.run(scenario())
+
+        assert cache.metrics.refresh_failures == 1
+        assert cache.metrics.refreshes == 1
+
+    def test_missing_timesheets_memoised_per_period(self, make_state: Callable[[], ReportState]) -> None:
+        cache = ReportCache(make_state, refresh_interval=60)
+
+        async def scenario() -> tuple[pd.DataFrame, pd.DataFrame]:
+            return await cache.missing_timesheets(REPORT_DATE), await cache.missing_timesheets(REPORT_DATE)
+
+        first, second = asyncio.run(scenario())
+
+        assert first is second
+        assert first["Employee ID"].tolist() == [506, 138, 506]
+
+    def test_age_is_none_before_first_load(self, make_state: Callable[[], ReportState]) -> None:
+        cache = ReportCache(make_state, refresh_interval=60)
+
+        assert cache.age is None
+        asyncio.run(cache.get())
+        assert cache.age is not None
+
+
+class TestServiceMetrics:
+    """Test cases for the ServiceMetrics class."""
+
+    def test_latency_summary(self) -> None:
+        metrics = ServiceMetrics()
+        for ms in range(1, 101):
+            metrics.record_request(ms / 1000, failed=ms > 98)
+
+        summary = metrics.latency_summary()
+
+        assert metrics.requests == 100
+        assert metrics.errors == 2
+        assert summary["p50_ms"] == pytest.approx(51)
+        assert summary["p95_ms"] == pytest.approx(96)
+        assert summary["max_ms"] == pytest.approx(100)
+
+    def test_latency_summary_without_requests(self) -> None:
+        assert ServiceMetrics().latency_summary()["p50_ms"] is None
@@ -0,0 +1,142 @@
+"""Unit tests for the report_diff module."""
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.report_diff import (
+    build_diff_sheets,
+    decode_report_keys,
+    diff_report_keys,
+    encode_report_keys,
+    encode_week_days,
+    load_report_keys,
+    report_keys_path,
+    save_report_keys,
+)
+
+EMPLOYEES = pd.DataFrame(
+    {
+        "EmployeeID": [138, 506, 715],
+        "FirstName": ["Blaire", "Nick", "Robert"],
+        "LastName": ["Alder", "Bell", "Higgins"],
+    }
+)
+
+
+def _report(rows: list[tuple[int, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Employee ID": [emp_id for emp_id, _week in rows],
+            "First Name": "",
+            "Last Name": "",
+            "Week Ending": [week for _emp_id, week in rows],
+        }
+    )
+
+
+class TestEncodeReportKeys:
+    """Test cases for encoding and decoding report keys."""
+
+    def test_round_trip(self) -> None:
+        report = _report([(715, "04/12/25"), (506, "27/11/25"), (506, "04/12/25")])
+
+        decoded = decode_report_keys(encode_report_keys(report), EMPLOYEES)
+
+        assert decoded.to_dict("records") == [
+            {"Employee ID": 506, "First Name": "Nick", "Last Name": "Bell", "Week Ending": "27/11/25"},
+            {"Employee ID": 506, "First Name": "Nick", "Last Name": "Bell", "Week Ending": "04/12/25"},
+            {"Employee ID": 715, "First Name": "Robert", "Last Name": "Higgins", "Week Ending": "04/12/25"},
+        ]
+
+    def test_keys_sorted_and_unique(self) -> None:
+        keys = encode_report_keys(_report([(715, "04/12/25"), (506, "27/11/25"), (715, "04/12/25")]))
+
+        assert len(keys) == 2
+        assert np.all(np.diff(keys) > 0)
+
+    def test_empty_report(self) -> None:
+        assert len(encode_report_keys(pd.DataFrame())) == 0
+
+    def test_unknown_employee_decodes_without_name(self) -> None:
+        decoded = decode_report_keys(encode_report_keys(_report([(999, "04/12/25")])), EMPLOYEES)
+
+        assert decoded.loc[0, "First Name"] == ""
+
+
+class TestDiffReportKeys:
+    """Test cases for the diff_report_keys function."""
+
+    def test_resolved_still_and_newly_missing(self) -> None:
+        previous = encode_report_keys(_report([(138, "04/12/25"), (506, "04/12/25")]))
+        current = encode_report_keys(_report([(506, "04/12/25"), (715, "04/12/25")]))
+
+        diff = diff_report_keys(previous, current)
+
+        assert (diff.resolved >> 32).tolist() == [138]
+        assert (diff.still_missing >> 32).tolist() == [506]
+        assert (diff.newly_missing >> 32).tolist() == [715]
+
+    def test_weeks_outside_period_are_not_resolved(self) -> None:
+        previous = encode_report_keys(_report([(138, "20/11/25"), (506, "27/11/25")]))
+        current = encode_report_keys(_report([(715, "04/12/25")]))
+        week_days = encode_week_days([date(2025, 11, 27), date(2025, 12, 4)])
+
+        diff = diff_report_keys(previous, current, week_days)
+
+        assert (diff.resolved >> 32).tolist() == [506]
+
+    def test_matches_set_semantics_for_large_backfill(self) -> None:
+        rng = np.random.default_rng(0)
+        weeks = pd.date_range("2025-01-02", periods=52, freq="7D").strftime("%d/%m/%y")
+        previous_rows = {
+            (int(e), str(w)) for e, w in zip(rng.integers(1, 5000, 60000), rng.choice(weeks, 60000), strict=True)
+        }
+        current_rows = {
+            (int(e), str(w)) for e, w in zip(rng.integers(1, 5000, 60000), rng.choice(weeks, 60000), strict=True)
+        }
+
+        diff = diff_report_keys(
+            encode_report_keys(_report(sorted(previous_rows))),
+            encode_report_keys(_report(sorted(current_rows))),
+        )
+
+        assert len(diff.resolved) == len(previous_rows - current_rows)
+        assert len(diff.still_missing) == len(previous_rows & current_rows)
+        assert len(diff.newly_missing) == len(current_rows - previous_rows)
+
+
+class TestReportKeysFile:
+    """Test cases for saving and loading keys."""
+
+    def test_keys_path_sits_next_to_report(self) -> None:
+        assert report_keys_path(Path("out") / "Report.xlsx") == Path("out") / "Report.keys.npy"
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        keys = encode_report_keys(_report([(506, "04/12/25")]))
+        path = tmp_path / "Report.keys.npy"
+
+        save_report_keys(path, keys)
+
+        loaded = load_report_keys(path)
+        assert loaded is not None
+        assert loaded.tolist() == keys.tolist()
+
+    def test_load_without_previous_run(self, tmp_path: Path) -> None:
+        assert load_report_keys(tmp_path / "missing.keys.npy") is None
+
+
+class TestBuildDiffSheets:
+    """Test cases for the build_diff_sheets function."""
+
+    def test_summary_counts(self) -> None:
+        previous = encode_report_keys(_report([(138, "04/12/25")]))
+        current = encode_report_keys(_report([(506, "04/12/25"), (715, "04/12/25")]))
+
+        sheets = build_diff_sheets(diff_report_keys(previous, current), EMPLOYEES)
+
+        assert list(sheets) == ["Changes Summary", "Newly Missing", "Still Missing", "Resolved"]
+        assert sheets["Changes Summary"]["Count"].tolist() == [1, 0, 2]
+        assert sheets["Resolved"]["Last Name"].tolist() == ["Alder"]
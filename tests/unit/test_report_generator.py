@@ -0,0 +1,177 @@
+"""Unit tests for the report_generator module."""
+
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+
+from src.report_generator import (
+    REPORT_COLUMNS,
+    build_employee_week_matrix,
+    evaluate_missing_timesheets,
+    identify_missing_timesheets,
+)
+
+# Mid-afternoon, as datetime.now() would be when the report runs
+REPORT_DATE = datetime(2025, 12, 8, 14, 30, tzinfo=UTC)
+WEEK1_DAYS = ["2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-27"]
+
+
+@pytest.fixture
+def employees() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "EmployeeID": [806, 506, 138, 21, 900, 715],
+            "FirstName": ["Sandy", "Nick", "Blaire", "Wayne", "New", "Robert"],
+            "LastName": ["Antipas", "Bell", "Alder", "Empson", "Starter", "Higgins"],
+            "StartDate": pd.to_datetime(["2020-01-01", "2020-01-01", "2020-01-01", None, "2025-11-28", "2020-01-01"]),
+            "PartialTimesheet": [True, False, False, False, False, False],
+        }
+    )
+
+
+@pytest.fixture
+def submitted() -> pd.DataFrame:
+    # 138 submitted on the Friday that starts week 2, with a time of day
+    return pd.DataFrame(
+        {
+            "EmployeeID": [715, 138],
+            "DatePeriod": pd.to_datetime(["2025-11-24 00:00", "2025-11-28 09:15"]),
+        }
+    )
+
+
+@pytest.fixture
+def leave() -> pd.DataFrame:
+    # 138 and 806 are on leave for the whole of week 1
+    return pd.DataFrame(
+        {
+            "Id": [138] * 5 + [806] * 5,
+            "Date": pd.to_datetime(WEEK1_DAYS * 2),
+            "Status": "Approved",
+            "Taken": "7.50",
+        }
+    )
+
+
+class TestBuildEmployeeWeekMatrix:
+    """Test cases for the build_employee_week_matrix function."""
+
+    def test_one_row_per_employee_week(
+        self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame
+    ) -> None:
+        matrix = build_employee_week_matrix(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+
+        assert len(matrix) == len(employees) * 2
+        assert sorted(matrix["WeekStart"].unique()) == [pd.Timestamp(2025, 11, 21), pd.Timestamp(2025, 11, 28)]
+        assert sorted(matrix["WeekEnd"].unique()) == [pd.Timestamp(2025, 11, 27), pd.Timestamp(2025, 12, 4)]
+
+    def test_flags(self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame) -> None:
+        matrix = build_employee_week_matrix(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+        flags = matrix.set_index(["EmployeeID", "WeekEnd"])
+
+        assert flags.loc[(138, pd.Timestamp(2025, 12, 4)), "Submitted"]
+        assert not flags.loc[(138, pd.Timestamp(2025, 11, 27)), "Submitted"]
+        assert flags.loc[(715, pd.Timestamp(2025, 11, 27)), "Submitted"]
+        assert flags.loc[(806, pd.Timestamp(2025, 11, 27)), "FullWeekLeave"]
+        assert not flags.loc[(806, pd.Timestamp(2025, 12, 4)), "FullWeekLeave"]
+        assert flags.loc[(21, pd.Timestamp(2025, 12, 4)), "Excluded"]
+        assert flags.loc[(806, pd.Timestamp(2025, 12, 4)), "PartialTimesheet"]
+
+    def test_office_public_holidays_need_no_leave(self, employees: pd.DataFrame) -> None:
+        employees["Office"] = ["New Zealand", "Cyprus", "", "", "", ""]
+        leave = pd.DataFrame(
+            {
+                "Id": [806] * 3 + [506] * 3,
+                "Date": pd.to_datetime(["2025-12-29", "2025-12-30", "2025-12-31"] * 2),
+                "Status": "Approved",
+                "Taken": "7.50",
+            }
+        )
+
+        matrix = build_employee_week_matrix(
+            employees,
+            pd.DataFrame(columns=["EmployeeID", "DatePeriod"]),
+            leave,
+            frozenset(),
+            datetime(2026, 1, 5, tzinfo=UTC),
+        )
+
+        covered = matrix.loc[matrix["FullWeekLeave"], ["EmployeeID", "WeekStart"]]
+        assert list(covered.itertuples(index=False, name=None)) == [(806, pd.Timestamp(2025, 12, 26))]
+
+    def test_partial_timesheet_defaults_to_false(self, employees: pd.DataFrame) -> None:
+        matrix = build_employee_week_matrix(
+            employees.drop(columns="PartialTimesheet"),
+            pd.DataFrame(columns=["EmployeeID", "DatePeriod"]),
+            pd.DataFrame(),
+            frozenset(),
+            REPORT_DATE,
+        )
+
+        assert not matrix["PartialTimesheet"].any()
+
+
+class TestIdentifyMissingTimesheets:
+    """Test cases for the identify_missing_timesheets function."""
+
+    def test_report_rows_and_order(self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame) -> None:
+        report = identify_missing_timesheets(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+
+        assert list(report.columns) == REPORT_COLUMNS
+        assert list(report.itertuples(index=False, name=None)) == [
+            (506, "Nick", "Bell", "27/11/25"),
+            (806, "Sandy", "Antipas", "27/11/25"),
+            (506, "Nick", "Bell", "04/12/25"),
+            (715, "Robert", "Higgins", "04/12/25"),
+            (806, "Sandy", "Antipas", "04/12/25"),
+            (900, "New", "Starter", "04/12/25"),
+        ]
+
+    def test_friday_submission_counts_for_its_week(
+        self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame
+    ) -> None:
+        report = identify_missing_timesheets(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+
+        assert 138 not in report["Employee ID"].tolist()
+
+    def test_full_week_leave_reported_for_partial_timesheets_only(
+        self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame
+    ) -> None:
+        employees["PartialTimesheet"] = False
+
+        report = identify_missing_timesheets(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+
+        assert report[report["Week Ending"] == "27/11/25"]["Employee ID"].tolist() == [506]
+
+    def test_excluded_employees_never_reported(
+        self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame
+    ) -> None:
+        report = identify_missing_timesheets(employees, submitted, leave, frozenset({21, 506}), REPORT_DATE)
+
+        assert not report["Employee ID"].isin([21, 506]).any()
+
+    def test_nothing_missing_returns_empty_report(self, employees: pd.DataFrame) -> None:
+        everyone = frozenset(employees["EmployeeID"].tolist())
+
+        report = identify_missing_timesheets(
+            employees, pd.DataFrame(columns=["EmployeeID", "DatePeriod"]), pd.DataFrame(), everyone, REPORT_DATE
+        )
+
+        assert report.empty
+        assert list(report.columns) == REPORT_COLUMNS
+
+
+class TestEvaluateMissingTimesheets:
+    """Test cases for the evaluate_missing_timesheets function."""
+
+    def test_stats_attribute_each_removed_row_once(
+        self, employees: pd.DataFrame, submitted: pd.DataFrame, leave: pd.DataFrame
+    ) -> None:
+        matrix = build_employee_week_matrix(employees, submitted, leave, frozenset({21}), REPORT_DATE)
+
+        report, stats = evaluate_missing_timesheets(matrix)
+
+        removed = {s.name: s.removed for s in stats}
+        assert removed == {"exclusion_list": 2, "not_started": 1, "submitted": 2, "full_week_leave": 1}
+        assert sum(removed.values()) + len(report) == len(matrix)
@@ -0,0 +1,110 @@
+"""Unit tests for the service module."""
+
+import asyncio
+import json
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+
+from src.report_cache import ReportCache, ReportState
+from src.service import ReportService
+
+
+async def _request(port: int, method: str, target: str) -> tuple[int, str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, body = response.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), body.decode("utf-8")
+
+
+@pytest.fixture
+def cache(make_state: Callable[[], ReportState]) -> ReportCache:
+    return ReportCache(make_state, refresh_interval=60)
+
+
+def _run(cache: ReportCache, *requests: tuple[str, str]) -> list[tuple[int, str]]:
+    async def scenario() -> list[tuple[int, str]]:
+        server = await asyncio.start_server(ReportService(cache).serve_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return [await _request(port, method, target) for method, target in requests]
+
+    return asyncio.run(scenario())
+
+
+class TestReportService:
+    """Test cases for the HTTP endpoints."""
+
+    def test_missing_json(self, cache: ReportCache) -> None:
+        [(status, body)] = _run(cache, ("GET", "/missing?date=2025-12-08"))
+
+        payload = json.loads(body)
+        assert status == 200
+        assert payload["period_end"] == "2025-12-04"
+        assert payload["count"] == 3
+        assert payload["rows"][0] == {
+            "Employee ID": 506,
+            "First Name": "Nick",
+            "Last Name": "Bell",
+            "Week Ending": "27/11/25",
+        }
+
+    def test_missing_csv_filtered_by_team(self, cache: ReportCache) -> None:
+        [(status, body)] = _run(cache, ("GET", "/missing?date=2025-12-08&team=europe&format=csv"))
+
+        assert status == 200
+        assert body.splitlines() == ["Employee ID,First Name,Last Name,Week Ending", "138,Blaire,Alder,04/12/25"]
+
+    def test_date_outside_window_rejected(self, cache: ReportCache) -> None:
+        [(status, body)] = _run(cache, ("GET", "/missing?date=2026-03-01"))
+
+        assert status == 400
+        assert "outside cached window" in json.loads(body)["error"]
+
+    def test_period_past_window_refreshes(self, make_state: Callable[[], ReportState]) -> None:
+        loads: list[ReportState] = []
+
+        def rolling_state() -> ReportState:
+            # Each load starts a week later, as when a refresh follows a rollover
+            state = make_state()
+            state.window_start += timedelta(days=7 * len(loads))
+            state.window_end += timedelta(days=7 * len(loads))
+            loads.append(state)
+            return state
+
+        cache = ReportCache(rolling_state, refresh_interval=60)
+        responses = _run(cache, ("GET", "/missing?date=2025-12-08"), ("GET", "/missing?date=2025-12-15"))
+
+        assert [status for status, _body in responses] == [200, 200]
+        assert json.loads(responses[1][1])["period_end"] == "2025-12-11"
+        assert len(loads) == 2
+
+    def test_bad_requests(self, cache: ReportCache) -> None:
+        responses = _run(
+            cache,
+            ("GET", "/missing?date=08/12/2025"),
+            ("GET", "/missing?format=xml"),
+            ("GET", "/unknown"),
+            ("GET", "/refresh"),
+        )
+
+        assert [status for status, _body in responses] == [400, 400, 404, 405]
+
+    def test_metrics_and_refresh(self, cache: ReportCache) -> None:
+        responses = _run(
+            cache,
+            ("GET", "/missing?date=2025-12-08"),
+            ("POST", "/refresh"),
+            ("GET", "/metrics"),
+        )
+
+        metrics = json.loads(responses[-1][1])
+        assert metrics["refreshes"] == 2
+        assert metrics["requests"] == 2
+        assert metrics["cache_age_seconds"] is not None
+        assert metrics["latency"]["max_ms"] > 0
+        assert cache.metrics.requests == 3
@@ -0,0 +1,117 @@
+"""Unit tests for the snapshot module and its query CLI."""
+
+import ast
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.snapshot import Snapshot, SnapshotEmployee, WeekStatus, write_snapshot
+from src.snapshot_query import query_employee, query_week
+
+WEEK1 = date(2025, 11, 27)
+WEEK2 = date(2025, 12, 4)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> Path:
+    path = tmp_path / "snapshot.bin"
+    employees = [
+        SnapshotEmployee(715, "Robert", "Higgins", "Europe"),
+        SnapshotEmployee(138, "Blaire", "Alder", "Europe"),
+        SnapshotEmployee(506, "Nick", "Bell", "Asia Pacific"),
+        SnapshotEmployee(21, "Wayne", "Empson", ""),
+    ]
+    statuses = {
+        (506, WEEK1): WeekStatus.MISSING,
+        (506, WEEK2): WeekStatus.MISSING,
+        (715, WEEK2): WeekStatus.MISSING,
+        (138, WEEK1): WeekStatus.SUBMITTED,
+        (138, WEEK2): WeekStatus.FULL_WEEK_LEAVE,
+        (21, WEEK1): WeekStatus.EXCLUDED,
+        (21, WEEK2): WeekStatus.EXCLUDED,
+    }
+    write_snapshot(path, employees, [WEEK2, WEEK1], statuses)
+    return path
+
+
+class TestSnapshot:
+    """Test cases for reading a written snapshot."""
+
+    def test_weeks_and_regions_are_sorted(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.week_ends == (WEEK1, WEEK2)
+            assert snapshot.regions == ("Asia Pacific", "Europe")
+
+    def test_employee_lookup(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.employee(506) == SnapshotEmployee(506, "Nick", "Bell", "Asia Pacific")
+            assert snapshot.employee(21) == SnapshotEmployee(21, "Wayne", "Empson", "")
+            assert snapshot.employee(999) is None
+
+    def test_status_lookup(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.status(506, WEEK1) == WeekStatus.MISSING
+            assert snapshot.status(138, WEEK2) == WeekStatus.FULL_WEEK_LEAVE
+            assert snapshot.status(715, WEEK1) == WeekStatus.NONE
+            assert snapshot.status(506, date(2025, 12, 11)) is None
+
+    def test_missing_weeks_for_employee(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.missing_weeks(506) == [WEEK1, WEEK2]
+            assert snapshot.missing_weeks(138) == []
+
+    def test_missing_employees_for_week(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert [emp.employee_id for emp in snapshot.missing_employees(WEEK2)] == [506, 715]
+            assert [emp.employee_id for emp in snapshot.missing_employees(WEEK2, "europe")] == [715]
+            assert snapshot.missing_employees(WEEK2, "Americas") == []
+
+    def test_rewrite_replaces_snapshot(self, snapshot_path: Path) -> None:
+        write_snapshot(snapshot_path, [SnapshotEmployee(1, "A", "B", "")], [WEEK1], {(1, WEEK1): WeekStatus.MISSING})
+
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.missing_weeks(1) == [WEEK1]
+            assert snapshot.employee(506) is None
+
+    def test_duplicate_employee_ids_raise_error(self, tmp_path: Path) -> None:
+        employees = [SnapshotEmployee(1, "A", "B", ""), SnapshotEmployee(1, "C", "D", "")]
+        with pytest.raises(ValueError, match="unique"):
+            write_snapshot(tmp_path / "snapshot.bin", employees, [WEEK1], {})
+
+    def test_invalid_file_raises_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "not_a_snapshot.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="Not a timesheet snapshot"):
+            Snapshot(path)
+
+
+class TestSnapshotQuery:
+    """Test cases for the snapshot query CLI."""
+
+    def test_query_employee_week(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert query_employee(snapshot, 506, WEEK2) == ["506 - Nick Bell (Asia Pacific): MISSING [missing]"]
+            assert query_employee(snapshot, 138, WEEK2) == [
+                "138 - Blaire Alder (Europe): not missing [full week leave]"
+            ]
+
+    def test_query_employee_all_weeks(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert query_employee(snapshot, 506, None) == ["506 - Nick Bell (Asia Pacific): missing 27/11/25, 04/12/25"]
+            assert query_employee(snapshot, 999, None) == ["Employee 999 is not in the snapshot"]
+
+    def test_query_week_by_region(self, snapshot_path: Path) -> None:
+        with Snapshot(snapshot_path) as snapshot:
+            assert query_week(snapshot, WEEK2, "Asia Pacific") == [
+                "1 missing for week ending 04/12/25 in Asia Pacific",
+                "  506 - Nick Bell (Asia Pacific)",
+            ]
+
+    def test_query_cli_does_not_import_pandas(self) -> None:
+        src_dir = Path(__file__).parents[2] / "src"
+        for module in ("snapshot_query.py", "snapshot.py", "config.py"):
+            tree = ast.parse((src_dir / module).read_text(encoding="utf-8"))
+            imported = {alias.name for node in ast.walk(tree) if isinstance(node, ast.Import) for alias in node.names}
+            imported |= {node.module or "" for node in ast.walk(tree) if isinstance(node, ast.ImportFrom)}
+            assert not {"pandas", "numpy"} & {name.split(".")[0] for name in imported}, module
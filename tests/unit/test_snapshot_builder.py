@@ -0,0 +1,89 @@
+"""Unit tests for the snapshot_builder module."""
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pandas as pd
+
+from src.pipeline import ReportInputs
+from src.snapshot import Snapshot, WeekStatus
+from src.snapshot_builder import build_week_statuses, save_snapshot
+
+# Mid-afternoon, as datetime.now() would be when the report runs
+REPORT_DATE = datetime(2025, 12, 8, 14, 30, tzinfo=UTC)
+WEEK1 = date(2025, 11, 27)
+WEEK2 = date(2025, 12, 4)
+
+
+def _inputs() -> ReportInputs:
+    return ReportInputs(
+        employees=pd.DataFrame(
+            {
+                "EmployeeID": [138, 506, 21, 715],
+                "FirstName": ["Blaire", "Nick", "Wayne", "Robert"],
+                "LastName": ["Alder", "Bell", "Empson", "Higgins"],
+                "StartDate": pd.to_datetime(["2020-01-01", "2020-01-01", "2020-01-01", "2025-11-28"]),
+            }
+        ),
+        exclusions=frozenset({21}),
+        submitted=pd.DataFrame({"EmployeeID": [138], "DatePeriod": pd.to_datetime(["2025-11-28"])}),
+        leave=pd.DataFrame(
+            {
+                "Id": [138] * 5,
+                "Date": pd.to_datetime(["2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-27"]),
+            }
+        ),
+    )
+
+
+class TestBuildWeekStatuses:
+    """Test cases for the build_week_statuses function."""
+
+    def test_report_time_of_day_does_not_shift_weeks(self) -> None:
+        statuses = build_week_statuses(_inputs(), REPORT_DATE)
+
+        assert statuses[(138, WEEK1)] == WeekStatus.FULL_WEEK_LEAVE
+        assert statuses[(138, WEEK2)] == WeekStatus.SUBMITTED
+        assert statuses[(506, WEEK1)] == WeekStatus.MISSING
+        assert statuses[(506, WEEK2)] == WeekStatus.MISSING
+        assert statuses[(21, WEEK1)] == WeekStatus.EXCLUDED
+        assert statuses[(715, WEEK1)] == WeekStatus.NOT_STARTED
+        assert statuses[(715, WEEK2)] == WeekStatus.MISSING
+
+    def test_same_statuses_at_midnight(self) -> None:
+        midnight = REPORT_DATE.replace(hour=0, minute=0)
+
+        assert build_week_statuses(_inputs(), midnight) == build_week_statuses(_inputs(), REPORT_DATE)
+
+    def test_start_time_on_first_friday_matches_report(self) -> None:
+        inputs = _inputs()
+        inputs.employees.loc[inputs.employees["EmployeeID"] == 715, "StartDate"] = pd.Timestamp("2025-11-21 09:00")
+
+        statuses = build_week_statuses(inputs, REPORT_DATE)
+
+        assert statuses[(715, WEEK1)] == WeekStatus.MISSING
+        assert statuses[(715, WEEK2)] == WeekStatus.MISSING
+
+    def test_excluded_flags_kept_alongside_other_reasons(self) -> None:
+        inputs = _inputs()
+        inputs.exclusions = frozenset({21, 138})
+
+        statuses = build_week_statuses(inputs, REPORT_DATE)
+
+        assert statuses[(138, WEEK1)] == WeekStatus.EXCLUDED | WeekStatus.FULL_WEEK_LEAVE
+        assert statuses[(138, WEEK2)] == WeekStatus.EXCLUDED | WeekStatus.SUBMITTED
+
+
+class TestSaveSnapshot:
+    """Test cases for the save_snapshot function."""
+
+    def test_snapshot_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "snapshot.bin"
+
+        save_snapshot(path, _inputs(), {506: "Asia Pacific", 715: "Europe"}, REPORT_DATE)
+
+        with Snapshot(path) as snapshot:
+            assert snapshot.week_ends == (WEEK1, WEEK2)
+            assert snapshot.status(138, WEEK2) == WeekStatus.SUBMITTED
+            assert snapshot.missing_weeks(506) == [WEEK1, WEEK2]
+            assert [emp.employee_id for emp in snapshot.missing_employees(WEEK2, "Europe")] == [715]